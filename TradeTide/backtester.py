@@ -93,17 +93,21 @@ class Backtester(BACKTESTER):
         # Plot market data
         self.market.plot(axes=axes, show=False, tight_layout=False)
 
-        # Get strategy signals
-        trade_signals = self.strategy.get_trade_signal(self.market)
+        # Strategy signals, as computed once when the backtester was built
+        trade_signals = self._cpp_position_collection.trade_signal
 
         # Plot buy/sell signals
-        buy_signals = np.where(np.array(trade_signals) == 1)[0]
-        sell_signals = np.where(np.array(trade_signals) == -1)[0]
+        buy_signals = np.where(trade_signals == 1)[0]
+        sell_signals = np.where(trade_signals == -1)[0]
+
+        # Every attribute access converts the whole C++ column, so fetch each one once
+        dates = np.asarray(self.market.dates)
+        ask_close = np.asarray(self.market.ask.close)
 
         if len(buy_signals) > 0:
             axes.scatter(
-                [self.market.dates[i] for i in buy_signals],
-                [self.market.ask.close[i] for i in buy_signals],
+                dates[buy_signals],
+                ask_close[buy_signals],
                 color="green",
                 marker="^",
                 s=60,
@@ -113,8 +117,8 @@ class Backtester(BACKTESTER):
 
         if len(sell_signals) > 0:
             axes.scatter(
-                [self.market.dates[i] for i in sell_signals],
-                [self.market.ask.close[i] for i in sell_signals],
+                dates[sell_signals],
+                ask_close[sell_signals],
                 color="red",
                 marker="v",
                 s=60,
@@ -200,7 +204,7 @@ class Backtester(BACKTESTER):
             )
 
             # Show max concurrent positions
-            max_positions = max(positions_data) if positions_data else 0
+            max_positions = positions_data.max() if len(positions_data) else 0
             axes.text(
                 0.02,
                 0.98,
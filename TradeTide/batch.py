@@ -0,0 +1,106 @@
+from itertools import product
+from typing import Iterable, List
+
+import numpy as np
+
+from TradeTide.market import Market
+from TradeTide.portfolio import Portfolio
+from TradeTide.position_collection import PositionCollection
+
+
+def simulate_grid(
+    market: Market,
+    trade_signal: np.ndarray,
+    exit_strategies: Iterable,
+    capital_managements: Iterable,
+    save_history: bool = False,
+) -> List[dict]:
+    """
+    Run every (exit strategy, capital management) combination against a single market and signal.
+
+    The market is loaded once by the caller and shared by every run. Positions only depend on the
+    exit strategy, so they are opened and propagated once per exit strategy and reused by every
+    capital management setting. Each portfolio keeps its own lot sizes and closing state, so the
+    runs sharing a collection do not overwrite each other. All exit strategies are propagated in
+    one batch, so each signal's price window is read from memory once for the whole grid.
+
+    Parameters
+    ----------
+    market : Market
+        Loaded market data shared by all runs.
+    trade_signal : np.ndarray
+        Trade signal aligned with the market (-1, 0, 1).
+    exit_strategies : Iterable[ExitStrategy]
+        Exit strategies to evaluate.
+    capital_managements : Iterable[BaseCapitalManagement]
+        Capital management settings to evaluate.
+    save_history : bool, default=False
+        Keep the per-tick portfolio history of each run (needed for metrics and plots).
+
+    Returns
+    -------
+    list of dict
+        One entry per combination with keys ``exit_strategy``, ``capital_management``,
+        ``portfolio``, ``final_equity`` and ``final_capital``.
+    """
+    exit_strategies = list(exit_strategies)
+    capital_managements = list(capital_managements)
+    results = []
+
+    position_collections = [
+        PositionCollection(market=market, trade_signal=trade_signal)
+        for _ in exit_strategies
+    ]
+    PositionCollection.open_and_propagate_positions_batch(
+        collections=position_collections, exit_strategies=exit_strategies
+    )
+
+    for exit_strategy, position_collection in zip(exit_strategies, position_collections):
+        for capital_management in capital_managements:
+            portfolio = Portfolio(
+                position_collection=position_collection, save_history=save_history
+            )
+            portfolio.simulate(capital_management=capital_management)
+
+            results.append(
+                dict(
+                    exit_strategy=exit_strategy,
+                    capital_management=capital_management,
+                    portfolio=portfolio,
+                    final_equity=portfolio.state.equity,
+                    final_capital=portfolio.state.capital,
+                )
+            )
+
+    return results
+
+
+def exit_strategy_grid(
+    exit_strategy_class,
+    stop_losses: Iterable[float],
+    take_profits: Iterable[float],
+    **kwargs,
+) -> list:
+    """
+    Build one exit strategy per (stop_loss, take_profit) pair.
+
+    Parameters
+    ----------
+    exit_strategy_class : type
+        Exit strategy class, e.g. ``exit_strategy.Static``.
+    stop_losses : Iterable[float]
+        Stop-loss distances in pips.
+    take_profits : Iterable[float]
+        Take-profit distances in pips.
+    **kwargs
+        Extra keyword arguments forwarded to every exit strategy.
+
+    Returns
+    -------
+    list
+        Exit strategies, ordered with the stop-loss varying slowest.
+    """
+    return [
+        exit_strategy_class(stop_loss=stop_loss, take_profit=take_profit, **kwargs)
+        for stop_loss, take_profit in product(stop_losses, take_profits)
+    ]
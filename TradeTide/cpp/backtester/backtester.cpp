@@ -8,18 +8,20 @@ Backtester::Backtester(Strategy& strategy, ExitStrategy& exit_strategy, Market&
     exit_strategy(exit_strategy),
     market(market),
     capital_management(capital_management),
-    position_collection(market, strategy.get_trade_signal(market), exit_strategy.save_price_data),
+    position_collection(this->market, this->compute_trade_signal(), exit_strategy.save_price_data),
     portfolio(position_collection)
 {
     position_collection.debug_mode = debug_mode;
     portfolio.debug_mode = debug_mode;
 }
 
+std::vector<int> Backtester::compute_trade_signal() {
+    ScopedTimer timer("Trade Signal Computation", trade_signal_computation_run_time);
+    return this->strategy.get_trade_signal(this->market);
+}
+
 void Backtester::run() {
     {
-        ScopedTimer timer("Trade Signal Computation", trade_signal_computation_run_time);
-        std::vector<int> trade_signal = strategy.get_trade_signal(market);
-    }{
         ScopedTimer timer("Opening Positions", open_position_run_time);
         position_collection.open_positions(exit_strategy);
     }{
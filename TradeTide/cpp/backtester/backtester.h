@@ -43,15 +43,15 @@ public:
     ExitStrategy &exit_strategy;
     Market market;
     BaseCapitalManagement &capital_management;
-    PositionCollection position_collection;
-    Portfolio portfolio;
-
-    // Timers for various phases
+    // Timers for various phases (declared before the members whose construction they time)
     std::chrono::microseconds trade_signal_computation_run_time;
     std::chrono::microseconds open_position_run_time;
     std::chrono::microseconds propagate_run_time;
     std::chrono::microseconds portfolio_run_time;
 
+    PositionCollection position_collection;
+    Portfolio portfolio;
+
     /*
     @brief Construct a Backtester with strategy, exit strategy, market data, and capital management
     @param strategy Reference to the trading strategy to be tested.
@@ -104,6 +104,13 @@ public:
     void print_run_times() const;
 
 private:
+    /*
+    @brief Compute the strategy's trade signal on the market, timing it.
+    @details Called once, while constructing the position collection; run() and the plots reuse
+    that signal instead of re-running every indicator.
+    */
+    std::vector<int> compute_trade_signal();
+
     /*
     @brief Print the header for a section.
     @details This method outputs a centered header with a title and surrounding
@@ -67,6 +67,13 @@ class ExitStrategy {
          */
         void update_price();
 
+        /**
+         * @brief Whether the stop-loss and take-profit levels stay fixed after initialization.
+         *
+         * Positions use this to skip the per-tick state update and scan the price series directly.
+         */
+        virtual bool is_static() const { return false; }
+
 };
 
 class StaticExitStrategy : public ExitStrategy {
@@ -91,6 +98,11 @@ class StaticExitStrategy : public ExitStrategy {
          * @return A unique pointer to the cloned static exit strategy.
          */
         std::unique_ptr<ExitStrategy> clone() const override;
+
+        /**
+         * @brief Static levels never move once the position is opened.
+         */
+        bool is_static() const override { return true; }
     };
 
 
@@ -1,13 +1,14 @@
 #pragma once
 
 #include <vector>
+#include <span>
 #include <cmath>
 #include <cassert>
 #include "../../market/market.h"
 
 class BaseIndicator {
 public:
-    const std::vector<double> *prices;
+    std::span<const double> prices;  ///< Price series being processed; only valid while the indicator runs
     std::vector<int> regions;
 
     BaseIndicator() = default;
@@ -31,12 +32,11 @@ public:
     /**
      * Run the indicator with a vector of prices.
      * This method processes the provided price vector to compute indicators and generate trading signals.
-     * @param prices The vector of prices to process.
-     * This method assumes that the `prices` member variable is set to point to the provided vector.
+     * @param prices The contiguous prices to process (a std::vector converts implicitly); they are read in place, not copied.
      * It processes the prices and generates signals based on the indicator logic.
      * @note This method is typically called after the price data has been loaded and is ready for analysis.
      */
-    void run_with_vector(const std::vector<double>& prices);
+    void run_with_vector(std::span<const double> prices);
 
     /**
      * Run the indicator with market data.
@@ -1,8 +1,17 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/numpy.h>
 
 #include "base_indicator.h"
 
+// Copy an indicator output buffer into a NumPy array in one go. Running the indicator again
+// reallocates its buffers, so an array sharing their memory would dangle.
+template <typename Indicator, typename T>
+pybind11::array_t<T> indicator_array(const Indicator& self, const std::vector<T> Indicator::*member) {
+    const std::vector<T>& buffer = self.*member;
+    return pybind11::array_t<T>(buffer.size(), buffer.data());
+}
+
 void register_base_indicator(const pybind11::module& module) {
 
     // BaseIndicator binding
@@ -22,27 +31,32 @@ void register_base_indicator(const pybind11::module& module) {
         )
         .def(
             "_cpp_run_with_vector",
-            &BaseIndicator::run_with_vector,
+            [](BaseIndicator& self, const pybind11::array_t<double, pybind11::array::c_style | pybind11::array::forcecast>& prices) {
+                // A contiguous float64 array is read in place; lists and other dtypes are converted by NumPy in one go.
+                if (prices.ndim() != 1)
+                    throw std::invalid_argument("prices must be one-dimensional.");
+
+                self.run_with_vector(std::span<const double>(prices.data(), static_cast<size_t>(prices.shape(0))));
+            },
             pybind11::arg("prices"),
             R"pbdoc(
                 Run the indicator on a raw price vector.
 
                 Parameters
                 ----------
-                prices : List[float]
-                    Time series of price values.
+                prices : array_like of float
+                    Time series of price values. A contiguous float64 NumPy array is used without copying.
             )pbdoc"
         )
-        .def_readonly(
+        .def_property_readonly(
             "_cpp_regions",
-            &BaseIndicator::regions,
-            pybind11::return_value_policy::reference_internal,
+            [](const BaseIndicator& self) { return indicator_array(self, &BaseIndicator::regions); },
             R"pbdoc(
                 Trade signal array.
 
                 Attributes
                 ----------
-                signals : List[int]
+                signals : numpy.ndarray
                     +1 for buy signal, -1 for sell signal, 0 otherwise.
             )pbdoc"
         )
@@ -2,7 +2,7 @@
 
 
 void BollingerBands::process() {
-    size_t n_elements = prices->size();
+    size_t n_elements = prices.size();
     this->initialize(n_elements);
 
     for (size_t i = 0; i < n_elements; ++i) {
@@ -19,14 +19,15 @@ void BollingerBands::initialize(size_t n_elements) {
     this->regions.assign(n_elements, 0);
     this->sum = 0.0;
     this->sum_sq = 0.0;
+    this->offset = n_elements > 0 ? prices[0] : 0.0;
 }
 
 void BollingerBands::update_window(size_t idx) {
-    double price = (*prices)[idx];
+    double price = prices[idx] - this->offset;
     this->sum += price;
     this->sum_sq += price * price;
     if (idx >= this->window) {
-        double old = (*prices)[idx - this->window];
+        double old = prices[idx - this->window] - this->offset;
         this->sum    -= old;
         this->sum_sq -= old * old;
     }
@@ -34,9 +35,10 @@ void BollingerBands::update_window(size_t idx) {
 
 void BollingerBands::compute_bands(size_t idx) {
     if (idx + 1 >= this->window) {
-        double mean = sum / static_cast<double>(this->window);
-        double variance = (sum_sq / static_cast<double>(this->window)) - (mean * mean);
+        double shifted_mean = sum / static_cast<double>(this->window);
+        double variance = (sum_sq / static_cast<double>(this->window)) - (shifted_mean * shifted_mean);
         double stddev = std::sqrt(std::max(variance, 0.0));
+        double mean = shifted_mean + this->offset;
         this->sma[idx] = mean;
         this->upper_band[idx] = mean + this->multiplier * stddev;
         this->lower_band[idx] = mean - this->multiplier * stddev;
@@ -45,7 +47,7 @@ void BollingerBands::compute_bands(size_t idx) {
 
 
 void BollingerBands::detect_regions(size_t idx) {
-    double price = (*this->prices)[idx];
+    double price = this->prices[idx];
 
     if (price < this->lower_band[idx]) // buy when price crosses below lower band
         this->regions[idx] = +1;
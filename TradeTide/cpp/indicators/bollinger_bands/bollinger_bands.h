@@ -29,6 +29,7 @@ public:
 private:
     double sum = 0.0;
     double sum_sq = 0.0;
+    double offset = 0.0;  ///< Reference price subtracted before accumulating, keeps sum_sq well conditioned
 
     /**
      * Process the Bollinger Bands indicator.
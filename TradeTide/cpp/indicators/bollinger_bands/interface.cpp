@@ -47,39 +47,39 @@ void register_bollinger_bands(const pybind11::module& module) {
                     Multiplier for the upper/lower bands.
             )pbdoc"
         )
-        .def_readonly(
+        .def_property_readonly(
             "_cpp_sma",
-            &BollingerBands::sma,
+            [](const BollingerBands& self) { return indicator_array(self, &BollingerBands::sma); },
             R"pbdoc(
                 Simple moving average values per time step.
 
                 Attributes
                 ----------
-                sma : List[float]
+                sma : numpy.ndarray
                     Series of simple moving average values.
             )pbdoc"
         )
-        .def_readonly(
+        .def_property_readonly(
             "_cpp_upper_band",
-            &BollingerBands::upper_band,
+            [](const BollingerBands& self) { return indicator_array(self, &BollingerBands::upper_band); },
             R"pbdoc(
                 Upper Bollinger Band values.
 
                 Attributes
                 ----------
-                upper : List[float]
+                upper : numpy.ndarray
                     Series of upper band values (SMA + multiplier * stddev).
             )pbdoc"
         )
-        .def_readonly(
+        .def_property_readonly(
             "_cpp_lower_band",
-            &BollingerBands::lower_band,
+            [](const BollingerBands& self) { return indicator_array(self, &BollingerBands::lower_band); },
             R"pbdoc(
                 Lower Bollinger Band values.
 
                 Attributes
                 ----------
-                lower : List[float]
+                lower : numpy.ndarray
                     Series of lower band values (SMA - multiplier * stddev).
             )pbdoc"
         )
@@ -8,7 +8,7 @@ MovingAverageCrossing::MovingAverageCrossing(size_t short_window, size_t long_wi
 }
 
 void MovingAverageCrossing::process() {
-    const size_t n_elements = this->prices->size();
+    const size_t n_elements = this->prices.size();
 
     this->initialize(n_elements);
 
@@ -25,24 +25,27 @@ void MovingAverageCrossing::initialize(size_t n_elements) {
     this->regions.assign(n_elements,  0);
     this->sum_short = 0.0;
     this->sum_long  = 0.0;
+    this->offset    = n_elements > 0 ? this->prices[0] : 0.0;
 }
 
 
 void MovingAverageCrossing::update_sums(size_t idx) {
-    this->sum_short += (*this->prices)[idx];
+    const double price = this->prices[idx] - this->offset;
+
+    this->sum_short += price;
     if (idx >= short_window)
-        this->sum_short -= (*this->prices)[idx - short_window];
+        this->sum_short -= this->prices[idx - short_window] - this->offset;
 
-    this->sum_long += (*this->prices)[idx];
+    this->sum_long += price;
     if (idx >= long_window)
-        this->sum_long -= (*this->prices)[idx - long_window];
+        this->sum_long -= this->prices[idx - long_window] - this->offset;
 }
 
 void MovingAverageCrossing::compute_mas(size_t idx) {
     if (idx + 1 >= short_window)
-        this->short_moving_average[idx] = this->sum_short / static_cast<double>(short_window);
+        this->short_moving_average[idx] = this->offset + this->sum_short / static_cast<double>(short_window);
     if (idx + 1 >= long_window)
-        this->long_moving_average[idx]  = this->sum_long  / static_cast<double>(long_window);
+        this->long_moving_average[idx]  = this->offset + this->sum_long  / static_cast<double>(long_window);
 }
 
 void MovingAverageCrossing::detect_regions(size_t idx) {
@@ -22,6 +22,7 @@ public:
 private:
     double sum_short = 0.0;
     double sum_long  = 0.0;
+    double offset    = 0.0;  ///< Reference price subtracted before accumulating, limits rounding drift
 
     /**
      * Process the moving average crossing strategy.
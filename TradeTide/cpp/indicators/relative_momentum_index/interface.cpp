@@ -77,15 +77,15 @@ void register_relative_momentum_index(const pybind11::module& module) {
                     Oversold threshold for RMI.
             )pbdoc"
         )
-        .def_readonly(
+        .def_property_readonly(
             "_cpp_rmi",
-            &RelativeMomentumIndex::rmi,
+            [](const RelativeMomentumIndex& self) { return indicator_array(self, &RelativeMomentumIndex::rmi); },
             R"pbdoc(
                 Relative Momentum Index values per time step.
 
                 Attributes
                 ----------
-                rmi : List[float]
+                rmi : numpy.ndarray
                     Series of RMI values (0–100).
             )pbdoc"
         )
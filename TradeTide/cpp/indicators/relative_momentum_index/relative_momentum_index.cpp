@@ -1,10 +1,12 @@
 #include "relative_momentum_index.h"
 
 void RelativeMomentumIndex::process() {
-    size_t n_elements = prices->size();
+    size_t n_elements = prices.size();
     this->initialize(n_elements);
 
-    for (size_t i = 0; i < n_elements; ++i) {
+    // Momentum, and everything derived from it, is undefined for the first momentum_period ticks:
+    // start there so the loop body never has to test for it.
+    for (size_t i = momentum_period; i < n_elements; ++i) {
         this->update_momentum(i);
         this->update_smoothing(i);
         this->compute_rmi(i);
@@ -20,25 +22,20 @@ void RelativeMomentumIndex::initialize(size_t n_elements) {
 }
 
 void RelativeMomentumIndex::update_momentum(size_t idx) {
-    if (idx >= momentum_period)
-        this->momentum[idx] = (*prices)[idx] - (*prices)[idx - momentum_period];
+    this->momentum[idx] = prices[idx] - prices[idx - momentum_period];
 }
 
 void RelativeMomentumIndex::update_smoothing(size_t idx) {
+    // Comparisons are false for NaN momentum (missing prices), which therefore contributes nothing.
     double m = momentum[idx];
-    if (!std::isnan(m)) {
-        if (m >= 0) sum_gain += m;
-        else        sum_loss += -m;
-    }
-    // remove old
-    size_t old_idx = idx >= smooth_period ? idx - smooth_period : std::string::npos;
-    if (old_idx != std::string::npos && !std::isnan(momentum[old_idx])) {
-        double old = this->momentum[old_idx];
+    this->sum_gain += m > 0 ? m : 0.0;
+    this->sum_loss += m < 0 ? -m : 0.0;
 
-        if (old >= 0)
-            this->sum_gain -= old;
-        else
-            this->sum_loss -= -old;
+    // remove the value leaving the window, once it is a defined momentum
+    if (idx >= momentum_period + smooth_period) {
+        double old = this->momentum[idx - smooth_period];
+        this->sum_gain -= old > 0 ? old : 0.0;
+        this->sum_loss -= old < 0 ? -old : 0.0;
     }
 }
 
@@ -1,8 +1,32 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/chrono.h>
+#include <pybind11/numpy.h>
 #include "market.h"  // Update path as needed
 
+// Contiguous float64 view of any array-like price column passed from Python.
+using PriceColumn = pybind11::array_t<double, pybind11::array::c_style | pybind11::array::forcecast>;
+
+// Timestamps passed from Python, either as a sequence of datetime or as a NumPy datetime64 array.
+// The array route reads the raw values instead of boxing one datetime object per row.
+std::vector<TimePoint> to_time_points(const pybind11::object& timestamps) {
+    if (pybind11::isinstance<pybind11::array>(timestamps)) {
+        const auto array = pybind11::reinterpret_borrow<pybind11::array>(timestamps);
+
+        if (array.dtype().kind() == 'M') {
+            if (array.ndim() != 1)
+                throw std::invalid_argument("Timestamps must be one-dimensional.");
+
+            const pybind11::array_t<int64_t, pybind11::array::c_style | pybind11::array::forcecast> microseconds =
+                array.attr("astype")("datetime64[us]").attr("view")("int64");
+
+            return Market::wall_clock_to_time_points(microseconds.data(), static_cast<size_t>(microseconds.size()));
+        }
+    }
+
+    return timestamps.cast<std::vector<TimePoint>>();
+}
+
 PYBIND11_MODULE(interface_market, module) {
     module.doc() = "Python bindings for Market, Bid, and Ask classes used in simulation.";
 
@@ -37,6 +61,23 @@ PYBIND11_MODULE(interface_market, module) {
             )pbdoc"
         )
 
+        .def(
+            "extend_from_csv",
+            &Market::extend_from_csv,
+            pybind11::arg("filename"),
+            pybind11::arg("time_span"),
+            R"pbdoc(
+                Append the rows of a CSV file that come after the last stored timestamp.
+
+                Parameters:
+                    filename (str): Path to the CSV file, in the same format as for load_from_csv.
+                    time_span (timedelta): Maximum duration of new data to append, counted from the first new row.
+
+                Returns:
+                    int: Number of rows appended (0 when the file holds nothing newer).
+            )pbdoc"
+        )
+
         .def("display", &Market::display_market_data, "Print a preview of the loaded market data.")
 
         // Read/write market metadata
@@ -105,6 +146,136 @@ PYBIND11_MODULE(interface_market, module) {
             )pbdoc"
         )
 
+        .def(
+            "add_market_arrays",
+            [](Market& self,
+               const pybind11::object& timestamps,
+               const PriceColumn& ask_open,
+               const PriceColumn& ask_high,
+               const PriceColumn& ask_low,
+               const PriceColumn& ask_close,
+               const PriceColumn& bid_open,
+               const PriceColumn& bid_high,
+               const PriceColumn& bid_low,
+               const PriceColumn& bid_close) {
+
+                const std::vector<TimePoint> time_points = to_time_points(timestamps);
+
+                for (const auto* column : {&ask_open, &ask_high, &ask_low, &ask_close, &bid_open, &bid_high, &bid_low, &bid_close})
+                    if (column->ndim() != 1 || static_cast<size_t>(column->size()) != time_points.size())
+                        throw std::invalid_argument("Every price column must be one-dimensional and as long as timestamps.");
+
+                self.add_market_arrays(
+                    time_points,
+                    ask_open.data(), ask_high.data(), ask_low.data(), ask_close.data(),
+                    bid_open.data(), bid_high.data(), bid_low.data(), bid_close.data()
+                );
+            },
+            pybind11::arg("timestamps"),
+            pybind11::arg("ask_open"),
+            pybind11::arg("ask_high"),
+            pybind11::arg("ask_low"),
+            pybind11::arg("ask_close"),
+            pybind11::arg("bid_open"),
+            pybind11::arg("bid_high"),
+            pybind11::arg("bid_low"),
+            pybind11::arg("bid_close"),
+            R"pbdoc(
+                Append whole columns of OHLC market data in one call.
+
+                Bulk counterpart of add_market_data(): row ``i`` is made of ``timestamps[i]`` and the i-th element of
+                every price column. Rows are validated exactly as in add_market_data(), but the prices are copied
+                straight from the NumPy buffers instead of going through one Python call per row.
+
+                Parameters
+                ----------
+                timestamps : Sequence[datetime] or numpy.ndarray of datetime64
+                    Timestamps of the new rows, in chronological order and not earlier than the last stored one.
+                    A naive datetime64 array is read directly, without building one datetime object per row.
+                ask_open, ask_high, ask_low, ask_close : array_like of float
+                    Ask OHLC columns, one value per timestamp.
+                bid_open, bid_high, bid_low, bid_close : array_like of float
+                    Bid OHLC columns, one value per timestamp.
+
+                Raises
+                ------
+                ValueError
+                    If a column length does not match, OHLC relationships are invalid or bid prices exceed ask prices.
+                RuntimeError
+                    If the timestamps are not in chronological order.
+
+                Notes
+                -----
+                The market is left unchanged when any row is rejected.
+
+                Examples
+                --------
+                >>> import datetime
+                >>> import numpy as np
+                >>> market = Market()
+                >>> timestamps = [datetime.datetime(2024, 1, 1, 9, minute) for minute in range(3)]
+                >>> mid = np.array([1.1050, 1.1052, 1.1049])
+                >>> market.add_market_arrays(timestamps, mid + 1e-4, mid + 1e-4, mid + 1e-4, mid + 1e-4, mid, mid, mid, mid)
+            )pbdoc"
+        )
+
+        .def(
+            "add_ticks",
+            [](Market& self,
+               const pybind11::object& timestamps,
+               const PriceColumn& ask_prices,
+               const PriceColumn& bid_prices) {
+
+                const std::vector<TimePoint> time_points = to_time_points(timestamps);
+
+                for (const auto* column : {&ask_prices, &bid_prices})
+                    if (column->ndim() != 1 || static_cast<size_t>(column->size()) != time_points.size())
+                        throw std::invalid_argument("Ask and bid prices must be one-dimensional and as long as timestamps.");
+
+                self.add_ticks(time_points, ask_prices.data(), bid_prices.data());
+            },
+            pybind11::arg("timestamps"),
+            pybind11::arg("ask_prices"),
+            pybind11::arg("bid_prices"),
+            R"pbdoc(
+                Append whole columns of tick data in one call.
+
+                Bulk counterpart of add_tick(): every OHLC value of row ``i`` is ``ask_prices[i]`` on the ask side and
+                ``bid_prices[i]`` on the bid side. The prices are copied straight from the NumPy buffers instead of
+                going through one Python call per tick.
+
+                Parameters
+                ----------
+                timestamps : Sequence[datetime] or numpy.ndarray of datetime64
+                    Timestamps of the new ticks, in chronological order and not earlier than the last stored one.
+                    A naive datetime64 array is read directly, without building one datetime object per tick.
+                ask_prices : array_like of float
+                    Ask price of each tick.
+                bid_prices : array_like of float
+                    Bid price of each tick. Must be <= the matching ask price.
+
+                Raises
+                ------
+                ValueError
+                    If a column length does not match or a bid price exceeds its ask price.
+                RuntimeError
+                    If the timestamps are not in chronological order.
+
+                Notes
+                -----
+                The market is left unchanged when any tick is rejected.
+
+                Examples
+                --------
+                >>> import datetime
+                >>> import numpy as np
+                >>> market = Market()
+                >>> timestamps = [datetime.datetime(2024, 1, 1, 9, 0, second) for second in range(3)]
+                >>> mid = np.array([1.1054, 1.1056, 1.1053])
+                >>> market.add_ticks(timestamps, mid + 1e-4, mid - 1e-4)
+            )pbdoc"
+        )
+
         .def(
             "add_tick",
             &Market::add_tick,
@@ -1,5 +1,69 @@
 #include "market.h"
 
+#include <algorithm>
+#include <charconv>
+#include <cstdlib>
+#include <limits>
+#include <string_view>
+
+namespace {
+
+// Split a CSV line on commas into views over the line, reusing the storage of `fields`.
+void split_csv_fields(const std::string& line, std::vector<std::string_view>& fields) {
+    fields.clear();
+    size_t start = 0;
+    while (true) {
+        const size_t end = line.find(',', start);
+        if (end == std::string::npos) {
+            fields.emplace_back(line.data() + start, line.size() - start);
+            return;
+        }
+        fields.emplace_back(line.data() + start, end - start);
+        start = end + 1;
+    }
+}
+
+// Parse a price field in place. strtod stops at the next comma, so no substring is built;
+// it is what std::stod uses, so values are identical.
+double parse_price(std::string_view field) {
+    char* end = nullptr;
+    const double value = std::strtod(field.data(), &end);
+    if (end == field.data())
+        throw std::invalid_argument("Invalid price field: " + std::string(field));
+    return value;
+}
+
+// Read a fixed-width unsigned integer at `pos`, followed by `separator` (or end of field if '\0').
+bool read_number(std::string_view s, size_t pos, size_t width, char separator, int& value) {
+    if (pos + width > s.size())
+        return false;
+    const auto [ptr, ec] = std::from_chars(s.data() + pos, s.data() + pos + width, value);
+    if (ec != std::errc() || ptr != s.data() + pos + width)
+        return false;
+    if (separator == '\0')
+        return true;
+    return pos + width < s.size() && s[pos + width] == separator;
+}
+
+// Fast path for the "YYYY-MM-DD HH:MM[...]" timestamps of the bundled data files.
+bool parse_date_fields(std::string_view s, std::tm& tm) {
+    int year, month, day, hour, minute;
+    if (!read_number(s, 0, 4, '-', year) || !read_number(s, 5, 2, '-', month) ||
+        !read_number(s, 8, 2, ' ', day) || !read_number(s, 11, 2, ':', hour) ||
+        !read_number(s, 14, 2, '\0', minute))
+        return false;
+
+    tm = {};
+    tm.tm_year = year - 1900;
+    tm.tm_mon = month - 1;
+    tm.tm_mday = day;
+    tm.tm_hour = hour;
+    tm.tm_min = minute;
+    return true;
+}
+
+} // namespace
+
 // Display market data with tabs between fields
 void
 Market::display_market_data() const {
@@ -101,6 +165,28 @@ std::vector<std::string> Market::split_csv_line(const std::string& line) {
 void Market::load_from_csv(
     const std::string& filename,
     const std::chrono::system_clock::duration& time_span
+) {
+    this->read_csv(filename, time_span, std::nullopt);
+
+    if (dates.empty()) {
+        throw std::runtime_error("No valid data rows found in: " + filename);
+    }
+}
+
+size_t Market::extend_from_csv(const std::string& filename, const Duration& time_span) {
+    if (dates.empty()) {
+        throw std::logic_error("Cannot extend an empty market; load it first.");
+    }
+
+    return this->read_csv(filename, time_span, dates.back());
+}
+
+// Appends the rows of a CSV file, optionally only those strictly after `after`.
+// The time span is counted from the first appended row.
+size_t Market::read_csv(
+    const std::string& filename,
+    const Duration& time_span,
+    const std::optional<TimePoint>& after
 ) {
     if (time_span <= std::chrono::system_clock::duration::zero()) {
         throw std::invalid_argument("Time span must be positive");
@@ -172,14 +258,49 @@ void Market::load_from_csv(
     // ─────────────────────────────────────────────
     bool first_entry = true;
     TimePoint first_time_point{};
+    size_t n_rows = 0;
+
+    const size_t n_columns = 1 + std::max({cols.date, cols.ask_open, cols.ask_high, cols.ask_low, cols.ask_close,
+                                           cols.bid_open, cols.bid_high, cols.bid_low, cols.bid_close});
+    std::vector<std::string_view> fields;
+    fields.reserve(n_columns);
+
+    // mktime is by far the most expensive step, and consecutive rows share the same hour:
+    // convert each hour once and add the minutes on top.
+    std::tm cached_hour = {};
+    std::time_t cached_hour_time = 0;
+    bool has_cached_hour = false;
 
     while (std::getline(file, line)) {
         if (line.empty()) continue;
 
-        const auto fields = split_csv_line(line);
+        split_csv_fields(line, fields);
+        if (fields.size() < n_columns)
+            throw std::runtime_error("Malformed CSV row (expected " + std::to_string(n_columns) + " fields): " + line);
 
         // Parse timestamp
-        const TimePoint current_time = parse_date_time(fields[cols.date]);
+        TimePoint current_time;
+        std::tm tm;
+        if (parse_date_fields(fields[cols.date], tm)) {
+            const bool same_hour = has_cached_hour &&
+                tm.tm_year == cached_hour.tm_year && tm.tm_mon == cached_hour.tm_mon &&
+                tm.tm_mday == cached_hour.tm_mday && tm.tm_hour == cached_hour.tm_hour;
+
+            if (!same_hour) {
+                cached_hour = tm;
+                cached_hour.tm_min = 0;
+                std::tm scratch = cached_hour;
+                cached_hour_time = std::mktime(&scratch);
+                has_cached_hour = true;
+            }
+            current_time = std::chrono::system_clock::from_time_t(cached_hour_time + 60 * tm.tm_min);
+        }
+        else
+            current_time = parse_date_time(std::string(fields[cols.date]));
+
+        // Skip rows the market already holds
+        if (after && current_time <= *after)
+            continue;
 
         // Stop when time_span exceeded
         if (first_entry) {
@@ -195,29 +316,31 @@ void Market::load_from_csv(
         // ASK data
         ask.push_back(
             current_time,
-            std::stod(fields[cols.ask_open]),
-            std::stod(fields[cols.ask_low]),
-            std::stod(fields[cols.ask_high]),
-            std::stod(fields[cols.ask_close])
+            parse_price(fields[cols.ask_open]),
+            parse_price(fields[cols.ask_low]),
+            parse_price(fields[cols.ask_high]),
+            parse_price(fields[cols.ask_close])
         );
 
         // BID data
         bid.push_back(
             current_time,
-            std::stod(fields[cols.bid_open]),
-            std::stod(fields[cols.bid_low]),
-            std::stod(fields[cols.bid_high]),
-            std::stod(fields[cols.bid_close])
+            parse_price(fields[cols.bid_open]),
+            parse_price(fields[cols.bid_low]),
+            parse_price(fields[cols.bid_high]),
+            parse_price(fields[cols.bid_close])
         );
-    }
 
-    if (dates.empty()) {
-        throw std::runtime_error("No valid data rows found in: " + filename);
+        ++n_rows;
     }
+
+    update_metadata();
+
+    return n_rows;
 }
 
 
-void Market::add_market_data(const TimePoint& timestamp, double ask_open, double ask_high, double ask_low, double ask_close, double bid_open, double bid_high, double bid_low, double bid_close) {
+void Market::validate_prices(double ask_open, double ask_high, double ask_low, double ask_close, double bid_open, double bid_high, double bid_low, double bid_close) {
     // Validate OHLC relationships for ask prices
     if (ask_low > ask_open || ask_low > ask_close || ask_low > ask_high) {
         throw std::invalid_argument("Ask low price cannot be greater than open, close, or high prices");
@@ -238,6 +361,25 @@ void Market::add_market_data(const TimePoint& timestamp, double ask_open, double
     if (bid_open > ask_open || bid_high > ask_high || bid_low > ask_low || bid_close > ask_close) {
         throw std::invalid_argument("Bid prices cannot be greater than corresponding ask prices");
     }
+}
+
+void Market::update_metadata() {
+    number_of_elements = dates.size();
+
+    if (dates.empty())
+        return;
+
+    start_date = dates.front();
+    end_date = dates.back();
+
+    // Calculate interval if we have at least 2 data points
+    if (dates.size() >= 2) {
+        interval = dates.back() - dates[dates.size() - 2];
+    }
+}
+
+void Market::add_market_data(const TimePoint& timestamp, double ask_open, double ask_high, double ask_low, double ask_close, double bid_open, double bid_high, double bid_low, double bid_close) {
+    validate_prices(ask_open, ask_high, ask_low, ask_close, bid_open, bid_high, bid_low, bid_close);
 
     // Validate chronological order
     if (!dates.empty() && timestamp < dates.back()) {
@@ -249,17 +391,94 @@ void Market::add_market_data(const TimePoint& timestamp, double ask_open, double
     bid.push_back(timestamp, bid_open, bid_low, bid_high, bid_close);
     dates.push_back(timestamp);
 
-    // Update market metadata
-    number_of_elements = dates.size();
-    if (dates.size() == 1) {
-        start_date = timestamp;
+    update_metadata();
+}
+
+void Market::add_market_arrays(
+    const std::vector<TimePoint>& timestamps,
+    const double* ask_open, const double* ask_high, const double* ask_low, const double* ask_close,
+    const double* bid_open, const double* bid_high, const double* bid_low, const double* bid_close)
+{
+    const size_t n_rows = timestamps.size();
+
+    // Validate everything first so a bad row leaves the market untouched
+    for (size_t idx = 0; idx < n_rows; ++idx) {
+        validate_prices(ask_open[idx], ask_high[idx], ask_low[idx], ask_close[idx], bid_open[idx], bid_high[idx], bid_low[idx], bid_close[idx]);
+
+        const TimePoint& previous = idx > 0 ? timestamps[idx - 1] : (dates.empty() ? timestamps[0] : dates.back());
+        if (timestamps[idx] < previous) {
+            throw std::logic_error("New timestamp must be greater than or equal to the last timestamp");
+        }
     }
-    end_date = timestamp;
 
-    // Calculate interval if we have at least 2 data points
-    if (dates.size() >= 2) {
-        interval = dates.back() - dates[dates.size() - 2];
+    auto append = [n_rows](std::vector<double>& column, const double* values) {
+        column.insert(column.end(), values, values + n_rows);
+    };
+
+    for (BasePrices* side : {&ask, &bid})
+        side->dates.insert(side->dates.end(), timestamps.begin(), timestamps.end());
+
+    append(ask.open, ask_open);
+    append(ask.high, ask_high);
+    append(ask.low, ask_low);
+    append(ask.close, ask_close);
+    append(bid.open, bid_open);
+    append(bid.high, bid_high);
+    append(bid.low, bid_low);
+    append(bid.close, bid_close);
+    dates.insert(dates.end(), timestamps.begin(), timestamps.end());
+
+    update_metadata();
+}
+
+void Market::add_ticks(const std::vector<TimePoint>& timestamps, const double* ask_prices, const double* bid_prices) {
+    add_market_arrays(
+        timestamps,
+        ask_prices, ask_prices, ask_prices, ask_prices,
+        bid_prices, bid_prices, bid_prices, bid_prices
+    );
+}
+
+std::vector<TimePoint> Market::wall_clock_to_time_points(const int64_t* microseconds, size_t count) {
+    constexpr int64_t microseconds_per_hour = 3600LL * 1000000LL;
+
+    std::vector<TimePoint> output;
+    output.reserve(count);
+
+    // mktime is by far the most expensive step, and consecutive timestamps share the same hour:
+    // convert each wall-clock hour once and add the offset within the hour.
+    int64_t cached_hour = 0;
+    std::time_t cached_hour_time = 0;
+    bool has_cached_hour = false;
+
+    for (size_t idx = 0; idx < count; ++idx) {
+        if (microseconds[idx] == std::numeric_limits<int64_t>::min())
+            throw std::invalid_argument("Timestamps cannot be NaT");
+
+        int64_t hour = microseconds[idx] / microseconds_per_hour;
+        if (microseconds[idx] % microseconds_per_hour < 0) --hour;
+
+        if (!has_cached_hour || hour != cached_hour) {
+            const std::chrono::sys_days day{std::chrono::days{hour >= 0 ? hour / 24 : (hour - 23) / 24}};
+            const std::chrono::year_month_day date{day};
+
+            std::tm tm = {};
+            tm.tm_year = static_cast<int>(date.year()) - 1900;
+            tm.tm_mon = static_cast<int>(static_cast<unsigned>(date.month())) - 1;
+            tm.tm_mday = static_cast<int>(static_cast<unsigned>(date.day()));
+            tm.tm_hour = static_cast<int>(hour - static_cast<int64_t>(day.time_since_epoch().count()) * 24);
+            tm.tm_isdst = -1;
+
+            cached_hour = hour;
+            cached_hour_time = std::mktime(&tm);
+            has_cached_hour = true;
+        }
+
+        const std::chrono::microseconds offset{microseconds[idx] - hour * microseconds_per_hour};
+        output.push_back(std::chrono::system_clock::from_time_t(cached_hour_time) + std::chrono::duration_cast<Duration>(offset));
     }
+
+    return output;
 }
 
 void Market::add_tick(const TimePoint& timestamp, double ask_price, double bid_price) {
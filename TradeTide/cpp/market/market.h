@@ -212,6 +212,22 @@ public:
      */
     void load_from_csv(const std::string& filename, const Duration& time_span);
 
+    /**
+     * @brief Append the rows of a CSV file that come after the last stored timestamp
+     *
+     * Incremental counterpart of load_from_csv(): rows already held by the market are
+     * skipped without parsing their prices, and at most `time_span` of new data
+     * (counted from the first new row) is appended.
+     *
+     * @param filename Path to the CSV file, in the same format as for load_from_csv()
+     * @param time_span Maximum duration of new data to append
+     * @return Number of rows appended (0 when the file holds nothing newer)
+     *
+     * @throws std::logic_error if the market is empty
+     * @throws std::runtime_error if the file cannot be opened or parsed
+     */
+    size_t extend_from_csv(const std::string& filename, const Duration& time_span);
+
     // ===============================
     // CSV Parsing Infrastructure
     // ===============================
@@ -357,4 +373,80 @@ public:
      * @note This is a convenience method that calls add_market_data() with identical OHLC values
      */
     void add_tick(const TimePoint& timestamp, double ask_price, double bid_price);
+
+    /**
+     * @brief Append whole columns of market data at once
+     *
+     * Bulk counterpart of add_market_data(): row i is made of timestamps[i] and the i-th
+     * element of each price column. Every row goes through the same validation, storage
+     * is reserved once, and metadata is updated once at the end. If a row is rejected the
+     * market is left unchanged.
+     *
+     * @param timestamps Timestamps of the new rows, in chronological order
+     * @param ask_open Ask opening prices (timestamps.size() elements)
+     * @param ask_high Ask highest prices
+     * @param ask_low Ask lowest prices
+     * @param ask_close Ask closing prices
+     * @param bid_open Bid opening prices
+     * @param bid_high Bid highest prices
+     * @param bid_low Bid lowest prices
+     * @param bid_close Bid closing prices
+     *
+     * @throws std::invalid_argument if OHLC relationships are violated or bid > ask
+     * @throws std::logic_error if the timestamps are not in chronological order
+     */
+    void add_market_arrays(
+        const std::vector<TimePoint>& timestamps,
+        const double* ask_open, const double* ask_high, const double* ask_low, const double* ask_close,
+        const double* bid_open, const double* bid_high, const double* bid_low, const double* bid_close);
+
+    /**
+     * @brief Append whole columns of tick data at once
+     *
+     * Bulk counterpart of add_tick(): every OHLC value of row i is set to ask_prices[i]
+     * on the ask side and bid_prices[i] on the bid side. Validation and the all-or-nothing
+     * guarantee are those of add_market_arrays().
+     *
+     * @param timestamps Timestamps of the new ticks, in chronological order
+     * @param ask_prices Ask prices (timestamps.size() elements)
+     * @param bid_prices Bid prices (timestamps.size() elements)
+     *
+     * @throws std::invalid_argument if a bid price is greater than its ask price
+     * @throws std::logic_error if the timestamps are not in chronological order
+     */
+    void add_ticks(const std::vector<TimePoint>& timestamps, const double* ask_prices, const double* bid_prices);
+
+    /**
+     * @brief Convert naive wall-clock timestamps to TimePoints
+     *
+     * Each value is a count of microseconds since 1970-01-01 00:00 on the wall clock, which is
+     * how NumPy stores a naive datetime64[us]. The wall-clock time is interpreted in the local
+     * time zone, exactly like a naive Python datetime or a CSV timestamp, so both ingestion
+     * routes yield the same TimePoints. mktime is only called once per wall-clock hour.
+     *
+     * @param microseconds Wall-clock timestamps in microseconds
+     * @param count Number of timestamps
+     * @return The corresponding TimePoints
+     * @throws std::invalid_argument if a timestamp is NaT
+     */
+    static std::vector<TimePoint> wall_clock_to_time_points(const int64_t* microseconds, size_t count);
+
+private:
+    /**
+     * @brief Shared CSV reader behind load_from_csv() and extend_from_csv()
+     * @param after When set, rows at or before this timestamp are skipped
+     * @return Number of rows appended
+     */
+    size_t read_csv(const std::string& filename, const Duration& time_span, const std::optional<TimePoint>& after);
+
+    /**
+     * @brief Check the OHLC relationships of both sides and the bid-ask spread of a single row
+     * @throws std::invalid_argument if any relationship is violated
+     */
+    static void validate_prices(double ask_open, double ask_high, double ask_low, double ask_close, double bid_open, double bid_high, double bid_low, double bid_close);
+
+    /**
+     * @brief Refresh number_of_elements, start/end dates and interval after rows were appended
+     */
+    void update_metadata();
 };
@@ -23,9 +23,10 @@ PYBIND11_MODULE(interface_portfolio, module) {
 
     pybind11::class_<Portfolio, std::shared_ptr<Portfolio>>(module, "PORTFOLIO")
         .def(
-            pybind11::init<PositionCollection&, bool>(),
+            pybind11::init<PositionCollection&, bool, bool>(),
             pybind11::arg("position_collection"),
             pybind11::arg("debug_mode") = false,
+            pybind11::arg("save_history") = true,
             R"pbdoc(
                 Create a portfolio simulator using a predefined position collection and capital management strategy.
 
@@ -33,8 +34,11 @@ PYBIND11_MODULE(interface_portfolio, module) {
                 ----------
                 position_collection : PositionCollection
                     The set of all candidate trades.
-                capital_management : BaseCapitalManagement
-                    Object that defines risk, lot sizing, and exposure limits.
+                debug_mode : bool
+                    Enable debug output for development purposes.
+                save_history : bool
+                    Record equity, capital and exposure at every tick. Required for metrics and plots;
+                    disable it for headless parameter sweeps that only need the final state.
             )pbdoc"
         )
         .def_readwrite(
@@ -99,13 +103,38 @@ PYBIND11_MODULE(interface_portfolio, module) {
                 Returns
                 -------
                 List[BasePosition]
-                    Positions selected by the portfolio during simulation.
+                    Positions selected by the portfolio during simulation. Their lot sizes for this run
+                    are in ``lot_sizes``.
             )pbdoc")
+        .def_readonly(
+            "selected_indices",
+            &Portfolio::selected_indices,
+            R"pbdoc(
+                Index, in the position collection, of each position accepted during the last simulation.
+            )pbdoc"
+        )
+        .def_readonly(
+            "lot_sizes",
+            &Portfolio::lot_sizes,
+            R"pbdoc(
+                Lot size allotted to each position of the collection during the last simulation (0 if not opened).
+
+                The positions themselves are shared by every portfolio built on the same collection, so
+                their ``lot_size`` attribute does not reflect this run.
+            )pbdoc"
+        )
+        .def_readonly(
+            "closed_positions",
+            &Portfolio::closed_positions,
+            R"pbdoc(
+                Whether each position of the collection was closed during the last simulation.
+            )pbdoc"
+        )
         .def(
             "display",
             &Portfolio::display,
             R"pbdoc(
-                Total time elapsed in the simulation, as a timedelta.
+                Print every accepted position with the lot size allotted to it.
             )pbdoc"
         )
         ;
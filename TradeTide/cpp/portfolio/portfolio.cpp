@@ -11,9 +11,11 @@ using TimePoint = std::chrono::system_clock::time_point;
 
 
 // ---------------- Constructor ----------------
-Portfolio::Portfolio(PositionCollection& position_collection, bool debug_mode): position_collection(position_collection), debug_mode(debug_mode) {
+Portfolio::Portfolio(PositionCollection& position_collection, bool debug_mode, bool save_history): position_collection(position_collection), debug_mode(debug_mode) {
     this->record.state = &this->state;
-    this->record.start_record(this->position_collection.market.dates.size());
+
+    if (save_history)
+        this->record.start_record(this->position_collection.market.dates.size());
 
     LOG_DEBUG(debug_mode, "Portfolio constructed\tMarketDates=%zu", position_collection.market.dates.size());
 }
@@ -22,15 +24,17 @@ Portfolio::Portfolio(PositionCollection& position_collection, bool debug_mode):
 
 // ---------------- Public Methods ----------------
 Metrics Portfolio::get_metrics() {
+    if (!this->record.is_enabled())
+        throw std::logic_error("Metrics require the portfolio history; construct the Portfolio with save_history=True.");
+
     Metrics metrics(this->record);
     metrics.calculate();
     return metrics;
 }
 
 void Portfolio::display() const {
-    for (const auto& position : this->executed_positions) {
-        position->display();
-    }
+    for (const size_t position_idx : this->selected_indices)
+        this->position_collection.positions[position_idx]->display(this->lot_sizes[position_idx]);
 }
 
 
@@ -40,12 +44,16 @@ double Portfolio::final_equity() const {
 }
 
 double Portfolio::peak_equity() const {
+    if (!this->record.is_enabled())
+        throw std::logic_error("Peak equity requires the portfolio history; construct the Portfolio with save_history=True.");
+
     return *std::max_element(this->record.equity.begin(), this->record.equity.end());
 }
 
 
 // ---------------- Position Management ----------------
-void Portfolio::open_position(PositionPtr& position) {
+void Portfolio::open_position(const size_t position_idx) {
+    PositionPtr& position = this->position_collection.positions[position_idx];
     double lot_size = this->capital_management->can_open_position(position);
 
     if (lot_size == 0.0) {
@@ -57,21 +65,21 @@ void Portfolio::open_position(PositionPtr& position) {
             this->state.capital,
             this->state.equity,
             position->entry_price,
-            position->lot_size,
+            lot_size,
             position->start_idx,
             position->is_long ? "Long" : "Short"
         );
         return;
     }
 
-    position->lot_size = lot_size;
-    this->active_positions.push_back(position);
+    this->lot_sizes[position_idx] = lot_size;
+    this->active_positions.push_back(position_idx);
+    this->selected_indices.push_back(position_idx);
     this->selected_positions.push_back(position);
     this->executed_positions.push_back(position);
 
     this->state.number_of_concurrent_positions += 1;
-    this->state.capital -= position->entry_price * position->lot_size;
-    position->is_closed = false;
+    this->state.capital -= position->entry_price * lot_size;
 
     LOG_DEBUG(debug_mode,
         "[+]  Step: %-4zu/ %-4zu  Capital: %-7.2f  Equity: %-7.2f \tEntryPrice=%-7.2f \tLotSize=%.2f \tIdx=%zu \tType=%s",
@@ -80,7 +88,7 @@ void Portfolio::open_position(PositionPtr& position) {
         this->state.capital,
         this->state.equity,
         position->entry_price,
-        position->lot_size,
+        lot_size,
         position->start_idx,
         position->is_long ? "Long" : "Short"
     );
@@ -88,17 +96,22 @@ void Portfolio::open_position(PositionPtr& position) {
 
 }
 
-void Portfolio::try_close_positions() {
+bool Portfolio::try_close_positions() {
+    const size_t n_active = this->active_positions.size();
+    const std::vector<size_t>& close_indices = this->position_collection.close_indices;
+
     this->active_positions.erase(
         std::remove_if(
             this->active_positions.begin(),
             this->active_positions.end(),
-            [&](PositionPtr& position) {
-                if (position->close_idx == this->state.time_idx) {
+            [&](const size_t position_idx) {
+                if (close_indices[position_idx] == this->state.time_idx) {
+                    PositionPtr& position = this->position_collection.positions[position_idx];
+
                     // Close position before erasing it
                     this->state.number_of_concurrent_positions -= 1;
-                    this->state.capital += position->exit_price * position->lot_size;
-                    position->is_closed = true;
+                    this->state.capital += this->position_collection.exit_prices[position_idx] * this->lot_sizes[position_idx];
+                    this->closed_positions[position_idx] = true;
                     double profit_loss = position->get_price_difference();
 
                     if (profit_loss > 0)
@@ -117,7 +130,7 @@ void Portfolio::try_close_positions() {
                         this->state.equity,
                         position->exit_price,
                         profit_loss,
-                        position->lot_size,
+                        this->lot_sizes[position_idx],
                         position->is_long ? "True" : "False"
                     );
 
@@ -126,30 +139,37 @@ void Portfolio::try_close_positions() {
                 return false; // keep this element
             }),
         this->active_positions.end());
+
+    return this->active_positions.size() != n_active;
 }
 
 
-void Portfolio::try_open_positions() {
-    while (this->state.position_index < this->position_collection.positions.size()) {
+bool Portfolio::try_open_positions() {
+    const size_t n_active = this->active_positions.size();
+    const std::vector<size_t>& start_indices = this->position_collection.start_indices;
+
+    while (this->state.position_index < start_indices.size()) {
 
         // If we reached the end of positions, stop trying to open new ones
-        if (this->position_collection.positions[this->state.position_index]->start_date != this->state.current_date)
+        if (start_indices[this->state.position_index] != this->state.time_idx)
             break;
 
-        PositionPtr& position = this->position_collection.positions[this->state.position_index];
-
         // If we can't open more positions now, skip this one (but advance index!)
-        this->open_position(position);
+        this->open_position(this->state.position_index);
 
         ++this->state.position_index;
     }
 
+    return this->active_positions.size() != n_active;
 }
 
 void Portfolio::simulate(BaseCapitalManagement& capital_management) {
     this->selected_positions.clear();
+    this->selected_indices.clear();
     this->executed_positions.clear();
     this->active_positions.clear();
+    this->lot_sizes.assign(this->position_collection.positions.size(), 0.0);
+    this->closed_positions.assign(this->position_collection.positions.size(), false);
 
     this->capital_management = &capital_management;
 
@@ -157,16 +177,25 @@ void Portfolio::simulate(BaseCapitalManagement& capital_management) {
     this->record.initial_capital = this->capital_management->initial_capital;
     this->capital_management->state  = &this->state;
 
-    this->position_collection.set_all_position_to_open();
+    const size_t n_dates = this->position_collection.market.dates.size();
 
-    for (size_t time_idx = 0; time_idx < this->position_collection.market.dates.size(); time_idx++) {
+    // Without a history to fill, nothing changes between two open/close events, so the
+    // accounting can jump from one event tick to the next instead of visiting every tick.
+    const bool every_tick = this->record.is_enabled() || this->debug_mode;
+
+    for (size_t time_idx = 0; time_idx < n_dates; time_idx = every_tick ? time_idx + 1 : this->next_event_idx(time_idx)) {
         this->state.update_time_idx(time_idx);
 
-        this->try_close_positions();
-        this->try_open_positions();
+        const bool closed_any = this->try_close_positions();
+        const bool opened_any = this->try_open_positions();
+
+        // Exit prices, lot sizes and stop-losses are fixed once positions are propagated,
+        // so exposure only changes on ticks where the active set itself changes.
+        if (closed_any || opened_any || time_idx == 0) {
+            this->state.capital_at_risk = this->calculate_capital_at_risk();
+            this->state.equity = this->calculate_equity();
+        }
 
-        this->state.capital_at_risk = this->calculate_capital_at_risk();
-        this->state.equity = this->calculate_equity();
         this->record.update();
 
         LOG_DEBUG(debug_mode,
@@ -181,18 +210,40 @@ void Portfolio::simulate(BaseCapitalManagement& capital_management) {
     }
 
     if (!this->active_positions.empty()) {
-        for (const auto& position : this->active_positions) {
-            printf("position closed at %zu\n", position->close_idx);
+        for (const size_t position_idx : this->active_positions) {
+            printf("position closed at %zu\n", this->position_collection.close_indices[position_idx]);
         }
         throw std::runtime_error("There are still active positions after simulation!");
     }
 }
 
+size_t Portfolio::next_event_idx(const size_t time_idx) const {
+    const size_t last_idx = this->position_collection.market.dates.size() - 1;
+
+    if (time_idx >= last_idx)
+        return time_idx + 1;
+
+    size_t next_idx = last_idx;
+
+    const std::vector<size_t>& start_indices = this->position_collection.start_indices;
+    if (this->state.position_index < start_indices.size())
+        next_idx = std::min(next_idx, start_indices[this->state.position_index]);
+
+    const std::vector<size_t>& close_indices = this->position_collection.close_indices;
+    for (const size_t position_idx : this->active_positions)
+        if (close_indices[position_idx] > time_idx)
+            next_idx = std::min(next_idx, close_indices[position_idx]);
+
+    return std::max(next_idx, time_idx + 1);
+}
+
 void Portfolio::terminate_open_positions() {
-    for (const auto& position : this->active_positions) {
+    for (const size_t position_idx : this->active_positions) {
+        PositionPtr& position = this->position_collection.positions[position_idx];
         position->close_at(this->position_collection.market.dates.size() - 1);
         this->state.number_of_concurrent_positions -= 1;
-        this->state.capital += position->exit_price * position->lot_size;
+        this->state.capital += position->exit_price * this->lot_sizes[position_idx];
+        this->closed_positions[position_idx] = true;
         this->executed_positions.push_back(position);
 
         LOG_DEBUG(debug_mode,
@@ -202,7 +253,7 @@ void Portfolio::terminate_open_positions() {
             this->state.capital,
             this->state.equity,
             position->exit_price,
-            position->lot_size,
+            this->lot_sizes[position_idx],
             position->start_idx,
             position->is_long ? "Long" : "Short",
             position->close_idx
@@ -239,8 +290,11 @@ std::vector<BasePosition*> Portfolio::get_positions(size_t count) const {
 double Portfolio::calculate_capital_at_risk() const {
     double total_risk = 0.0;
 
-    for (const PositionPtr& position : this->active_positions)
-        total_risk += std::abs(position->entry_price - position->exit_strategy->stop_loss_price) * position->lot_size;
+    const std::vector<double>& entry_prices = this->position_collection.entry_prices;
+    const std::vector<double>& stop_loss_prices = this->position_collection.stop_loss_prices;
+
+    for (const size_t position_idx : this->active_positions)
+        total_risk += std::abs(entry_prices[position_idx] - stop_loss_prices[position_idx]) * this->lot_sizes[position_idx];
 
     return total_risk;
 }
@@ -248,8 +302,10 @@ double Portfolio::calculate_capital_at_risk() const {
 double Portfolio::calculate_equity() const {
     double equity = this->state.capital;
 
-    for (const PositionPtr& position : this->active_positions)
-        equity += position->exit_price * position->lot_size;
+    const std::vector<double>& exit_prices = this->position_collection.exit_prices;
+
+    for (const size_t position_idx : this->active_positions)
+        equity += exit_prices[position_idx] * this->lot_sizes[position_idx];
 
 
     return equity;
@@ -30,8 +30,13 @@ public:
     /// Reference to the source collection of all potential positions.
     PositionCollection& position_collection;
 
+    // Per-run state is kept here rather than on the positions, so several portfolios can
+    // simulate the same propagated PositionCollection without overwriting each other.
     std::vector<PositionPtr> selected_positions;  ///< Positions accepted for simulation
-    std::vector<PositionPtr> active_positions;    ///< Currently open positions
+    std::vector<size_t> selected_indices;         ///< Indices (into the collection) of the accepted positions
+    std::vector<size_t> active_positions;         ///< Indices (into the collection) of currently open positions
+    std::vector<double> lot_sizes;                ///< Lot size allotted to each position of the collection
+    std::vector<bool> closed_positions;           ///< Whether each position of the collection was closed in this run
     std::vector<PositionPtr> executed_positions;  ///< All positions ever opened
 
     bool debug_mode = false;  ///< Enable debug output for development purposes
@@ -40,9 +45,10 @@ public:
      * @brief Construct a Portfolio with a position source and capital strategy.
      *
      * @param position_collection A reference to the collection of all tradable signals.
-     * @param capital_management  A capital management strategy that controls lot sizing.
+     * @param debug_mode          Enable debug output for development purposes.
+     * @param save_history        Record equity, capital and exposure at every tick (needed for metrics and plots).
      */
-    Portfolio(PositionCollection& position_collection, bool debug_mode = false);
+    Portfolio(PositionCollection& position_collection, bool debug_mode = false, bool save_history = true);
 
     /**
      * @brief Run the simulation using current strategy and portfolio constraints.
@@ -50,7 +56,7 @@ public:
     void simulate(BaseCapitalManagement& capital_management);
 
     /**
-     * @brief Display final performance metrics in human-readable form.
+     * @brief Display every accepted position with the lot size this run allotted to it.
      */
     void display() const;
 
@@ -116,16 +122,20 @@ public:
      *
      * This method will iterate through all active positions and close them
      * if they meet the criteria defined by the exit strategy.
+     *
+     * @return True if at least one position was closed.
      */
-    void try_close_positions();
+    bool try_close_positions();
 
     /**
      * @brief Attempt to open new positions based on the current capital management strategy.
      *
      * This method will iterate through the position collection and try to open
      * positions that meet the criteria defined by the capital management strategy.
+     *
+     * @return True if at least one position was opened.
      */
-    void try_open_positions();
+    bool try_open_positions();
 
     /**
      * @brief Close all currently open positions at the current market price.
@@ -152,7 +162,20 @@ public:
      * This method will attempt to open a position using the specified capital management
      * strategy, which determines lot sizing and risk management.
      *
-     * @param position Reference to the PositionPtr that will be opened.
+     * @param position_idx Index of the position in the position collection.
+     */
+    void open_position(const size_t position_idx);
+
+private:
+    /**
+     * @brief Index of the next tick at which a position opens or closes.
+     *
+     * Used by simulate() to skip the ticks in between when no history is recorded.
+     * Falls back to the last market tick when no event remains, and never returns
+     * an index before time_idx + 1.
+     *
+     * @param time_idx Index of the tick just processed.
+     * @return Index of the next tick to process.
      */
-    void open_position(PositionPtr& position);
+    [[nodiscard]] size_t next_event_idx(const size_t time_idx) const;
 };
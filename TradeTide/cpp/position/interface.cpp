@@ -50,7 +50,7 @@ PYBIND11_MODULE(interface_position, module) {
             R"pbdoc(
                 Datetime when the position was closed.
             )pbdoc")
-        .def("display", &BasePosition::display,
+        .def("display", py::overload_cast<>(&BasePosition::display, py::const_),
             R"pbdoc(
                 Print a summary of the position details to the console.
             )pbdoc")
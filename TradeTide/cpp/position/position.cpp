@@ -1,5 +1,7 @@
 #include "position.h"
 
+#include <bit>
+
 #include "../exit_strategy/exit_strategy.h"
 
 
@@ -63,6 +65,10 @@ void BasePosition::close_at(const size_t time_idx) {
 
 // Display Position Info
 void BasePosition::display() const {
+    this->display(this->lot_size);
+}
+
+void BasePosition::display(const double lot_size) const {
     if (this->is_long)
         std::cout << "Long Position:\n";
     else
@@ -87,6 +93,9 @@ double BasePosition::get_closing_value_at(const size_t time_idx) const {
 
 // Check if stop-loss or take-profit is hit
 void BasePosition::propagate() {
+    if (this->exit_strategy->is_static() && !this->exit_strategy->save_price_data)
+        return this->propagate_static();
+
     for (size_t time_idx = this->start_idx + 1; time_idx < this->state.n_elements - 1; time_idx++) {
         this->state.update_time_idx(time_idx);
 
@@ -103,6 +112,55 @@ void BasePosition::propagate() {
         throw std::runtime_error("FROM POSITION CLASS: Position cannot be closed at the same time it is opened!");
 }
 
+void BasePosition::propagate_static() {
+    const BasePrices &side = this->is_long ? this->state.market->bid : this->state.market->ask;
+    const double *low = side.low.data();
+    const double *high = side.high.data();
+    const double stop_loss = this->exit_strategy->stop_loss_price;
+    const double take_profit = this->exit_strategy->take_profit_price;
+    const size_t end_idx = this->state.n_elements - 1;
+
+    // Whatever the direction, an exit is triggered when the low reaches the lower level
+    // or the high reaches the upper one: (SL, TP) for a long, (TP, SL) for a short.
+    const double lower_level = this->is_long ? stop_loss : take_profit;
+    const double upper_level = this->is_long ? take_profit : stop_loss;
+
+    auto close_on_trigger = [&](const size_t time_idx) {
+        const bool stop_loss_hit = this->is_long ? low[time_idx] <= stop_loss : high[time_idx] >= stop_loss;
+
+        this->state.update_time_idx(time_idx);
+
+        if (stop_loss_hit)
+            return this->terminate_with_stop_lose();
+
+        return this->terminate_with_take_profit();
+    };
+
+    // Test ticks by fixed-size blocks without branching inside a block so the compiler can
+    // vectorize the compares; only the first set bit of a non-zero hit mask matters.
+    constexpr size_t block_size = 8;
+    size_t time_idx = this->start_idx + 1;
+
+    for (; time_idx + block_size <= end_idx; time_idx += block_size) {
+        unsigned int hit_mask = 0;
+
+        for (size_t lane = 0; lane < block_size; lane++)
+            hit_mask |= static_cast<unsigned int>(
+                (low[time_idx + lane] <= lower_level) | (high[time_idx + lane] >= upper_level)
+            ) << lane;
+
+        if (hit_mask != 0)
+            return close_on_trigger(time_idx + std::countr_zero(hit_mask));
+    }
+
+    for (; time_idx < end_idx; time_idx++)
+        if (low[time_idx] <= lower_level || high[time_idx] >= upper_level)
+            return close_on_trigger(time_idx);
+
+    if (this->start_idx == this->close_idx)
+        throw std::runtime_error("FROM POSITION CLASS: Position cannot be closed at the same time it is opened!");
+}
+
 // --------------------- Long Position ------------------------
 Long::Long(const ExitStrategy &exit_strategy, const size_t time_idx, const Market &market)
     : BasePosition(exit_strategy, time_idx, true)
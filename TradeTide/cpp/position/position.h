@@ -52,6 +52,14 @@ public:
      */
     void propagate();
 
+    /**
+     * @brief Fast path of propagate() for exit strategies with fixed SL/TP levels.
+     *
+     * Scans the closing-side low/high series directly instead of refreshing the full
+     * state at each tick, then closes the position at the first triggered level.
+     */
+    void propagate_static();
+
     /**
      * @brief Calculates profit or loss of the position.
      * @return PnL as a double (positive = profit, negative = loss)
@@ -63,6 +71,12 @@ public:
      */
     void display() const;
 
+    /**
+     * @brief Prints position summary to console with the lot size a portfolio allotted to it.
+     * @param lot_size Lot size to report instead of the position's own.
+     */
+    void display(const double lot_size) const;
+
     /**
      * @brief Returns stop-loss price history from the ExitStrategy.
      */
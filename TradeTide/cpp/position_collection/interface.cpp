@@ -1,11 +1,20 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/chrono.h>
+#include <pybind11/numpy.h>
 #include "position_collection.h"
 
 
 namespace py = pybind11;
 
+// Copy a position column into a NumPy array in one go. Opening or propagating the positions again
+// rebuilds the columns, so an array sharing their memory would dangle.
+template <typename T>
+py::array_t<T> column_array(const PositionCollection& self, const std::vector<T> PositionCollection::*member) {
+    const std::vector<T>& column = self.*member;
+    return py::array_t<T>(column.size(), column.data());
+}
+
 PYBIND11_MODULE(interface_position_collection, module) {
     module.doc() = R"pbdoc(
         Python bindings for the PositionCollection class.
@@ -20,11 +29,16 @@ PYBIND11_MODULE(interface_position_collection, module) {
     // Bind the Position class
     py::class_<PositionCollection, std::shared_ptr<PositionCollection>>(module, "POSITIONCOLLECTION")
         .def(
-            py::init<const Market&, const std::vector<int>&, const bool&, const bool&>(),
+            // Copy the signal straight out of the NumPy buffer; the generic list conversion costs tens of ms per 100k ticks.
+            py::init([](const Market& market, py::array_t<int, py::array::c_style | py::array::forcecast> trade_signal, bool save_price_data, bool debug_mode) {
+                const std::vector<int> signal(trade_signal.data(), trade_signal.data() + trade_signal.size());
+                return std::make_shared<PositionCollection>(market, signal, save_price_data, debug_mode);
+            }),
             py::arg("market"),
             py::arg("trade_signal"),
             py::arg("save_price_data") = false,
             py::arg("debug_mode") = false,
+            py::keep_alive<1, 2>(),
             R"pbdoc(
                 Create a new PositionCollection.
 
@@ -57,6 +71,26 @@ PYBIND11_MODULE(interface_position_collection, module) {
                 closes them at either stop-loss or take-profit, whichever is hit first.
             )pbdoc")
 
+        .def("open_and_propagate_positions", &PositionCollection::open_and_propagate_positions,
+            py::arg("exit_strategy"),
+            R"pbdoc(
+                Open and propagate all positions in a single pass over the signal.
+
+                Equivalent to calling `open_positions` followed by `propagate_positions`, but each
+                position is propagated right after it is opened.
+            )pbdoc")
+
+        .def_static("open_and_propagate_positions_batch", &PositionCollection::open_and_propagate_positions_batch,
+            py::arg("collections"),
+            py::arg("exit_strategies"),
+            R"pbdoc(
+                Open and propagate the same signal under several exit strategies at once.
+
+                ``collections[k]`` receives the positions of ``exit_strategies[k]``. All collections must be
+                empty and share the same market and trade signal. Positions opened at the same signal are
+                propagated back to back for every strategy, so each price window is read from memory once.
+            )pbdoc")
+
         .def("terminate_open_positions", &PositionCollection::terminate_open_positions,
             R"pbdoc(
                 Force-close any remaining open positions at the last available market price.
@@ -94,11 +128,52 @@ PYBIND11_MODULE(interface_position_collection, module) {
                 Return a list of exit prices for all positions.
             )pbdoc")
 
+        .def_property_readonly("trade_signal",
+            [](py::object self) {
+                const std::vector<int>& signal = self.cast<PositionCollection&>().trade_signal;
+                py::array_t<int> view(signal.size(), signal.data(), self);
+                view.attr("setflags")(py::arg("write") = false);
+                return view;
+            },
+            R"pbdoc(
+                Trade signal the collection was built from (read-only NumPy view, no copy).
+            )pbdoc")
+
+        .def_property_readonly("start_indices", [](const PositionCollection& self) { return column_array(self, &PositionCollection::start_indices); },
+            R"pbdoc(
+                Opening market index of each propagated position (NumPy copy).
+            )pbdoc")
+
+        .def_property_readonly("close_indices", [](const PositionCollection& self) { return column_array(self, &PositionCollection::close_indices); },
+            R"pbdoc(
+                Closing market index of each propagated position (NumPy copy).
+            )pbdoc")
+
+        .def_property_readonly("entry_prices", [](const PositionCollection& self) { return column_array(self, &PositionCollection::entry_prices); },
+            R"pbdoc(
+                Entry price of each propagated position (NumPy copy).
+            )pbdoc")
+
+        .def_property_readonly("exit_prices", [](const PositionCollection& self) { return column_array(self, &PositionCollection::exit_prices); },
+            R"pbdoc(
+                Exit price of each propagated position (NumPy copy).
+            )pbdoc")
+
+        .def_property_readonly("stop_loss_prices", [](const PositionCollection& self) { return column_array(self, &PositionCollection::stop_loss_prices); },
+            R"pbdoc(
+                Final stop-loss level of each propagated position (NumPy copy).
+            )pbdoc")
+
         .def_readwrite("number_of_trade", &PositionCollection::number_of_trade,
             R"pbdoc(
                 The number of trades (non-zero entries in the signal).
             )pbdoc")
 
+        .def_readonly("signal_indices", &PositionCollection::signal_indices,
+            R"pbdoc(
+                Market indices carrying a non-zero signal, i.e. where positions are opened.
+            )pbdoc")
+
         .def("get_market", &PositionCollection::get_market,
             R"pbdoc(
                 Get a reference to the underlying Market object used in the collection.
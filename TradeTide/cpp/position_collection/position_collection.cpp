@@ -6,9 +6,19 @@
 
 #include "position_collection.h"
 
+#include <exception>
+
 PositionCollection::PositionCollection(const Market& market, const std::vector<int>& trade_signal, const bool save_price_data, const bool debug_mode)
     : market(market), trade_signal(trade_signal), save_price_data(save_price_data), debug_mode(debug_mode)
 {
+    // Positions are only opened up to the second-to-last tick, so they always have room to close.
+    const size_t n_ticks = std::min(this->trade_signal.size(), this->market.dates.size());
+    const size_t last_open_idx = n_ticks > 0 ? n_ticks - 1 : 0;
+
+    for (size_t time_idx = 0; time_idx < last_open_idx; time_idx++)
+        if (this->trade_signal[time_idx] != 0)
+            this->signal_indices.push_back(time_idx);
+
     this->number_of_trade = std::count_if(
         this->trade_signal.begin(),
         this->trade_signal.end(),
@@ -73,39 +83,49 @@ void PositionCollection::to_csv(const std::string& filepath) const {
     file.close();
 }
 
-void PositionCollection::open_positions(const ExitStrategy &exit_strategy) {
-    for (size_t time_idx = 0; time_idx < this->market.dates.size() - 1; time_idx++) {
-        int signal_value = this->trade_signal[time_idx];
-
-        if (signal_value == 0)
-            continue;
+PositionPtr PositionCollection::make_position(const ExitStrategy &exit_strategy, const size_t time_idx) const {
+    if (this->trade_signal[time_idx] == 1)
+        return std::make_unique<Long>(exit_strategy, time_idx, this->market);
 
-        PositionPtr position;
+    return std::make_unique<Short>(exit_strategy, time_idx, this->market);
+}
 
-        if (signal_value == 1)
-            position = std::make_unique<Long>(exit_strategy, time_idx, this->market);
-        else
-            position = std::make_unique<Short>(exit_strategy, time_idx, this->market);
+void PositionCollection::open_positions(const ExitStrategy &exit_strategy) {
+    for (const size_t time_idx : this->signal_indices) {
+        PositionPtr position = this->make_position(exit_strategy, time_idx);
 
         LOG_DEBUG(debug_mode,
             "Opened position  Type=%-5s  TimeIdx=%-6zu  StartIdx=%-6zu",
-            signal_value == 1 ? "Long" : "Short",
+            position->is_long ? "Long" : "Short",
             time_idx,
             position->start_idx);
-                positions.push_back(std::move(position));
-            }
 
-        LOG_DEBUG(debug_mode, "Total positions opened  Count=%-6zu\n", positions.size());
-}
+        positions.push_back(std::move(position));
+    }
 
+    LOG_DEBUG(debug_mode, "Total positions opened  Count=%-6zu\n", positions.size());
+}
 
 
 void PositionCollection::propagate_positions() {
     LOG_DEBUG(debug_mode, "Propagating %zu positions...", positions.size());
 
-    #pragma omp parallel for
-    for (const auto& position : positions) {
-        position->propagate();
+    // Positions are independent: each one only reads the shared market and writes its own state.
+    // Exceptions cannot cross the parallel region, so the first one is kept and rethrown after it.
+    std::exception_ptr error = nullptr;
+
+    #pragma omp parallel for schedule(dynamic, 64)
+    for (size_t idx = 0; idx < this->positions.size(); idx++) {
+        const PositionPtr& position = this->positions[idx];
+
+        try {
+            position->propagate();
+        } catch (...) {
+            #pragma omp critical
+            if (!error)
+                error = std::current_exception();
+        }
+
         LOG_DEBUG(debug_mode,
             "Propagated position #%-4zu  [%-5s]  entry: %-8.2f  lot: %-6.2f  is_closed: %s",
             position->start_idx,
@@ -116,17 +136,97 @@ void PositionCollection::propagate_positions() {
         );
     }
 
+    if (error)
+        std::rethrow_exception(error);
+
     LOG_DEBUG(debug_mode, "All positions propagated\n");
 
+    this->finalize_positions();
+}
+
+
+void PositionCollection::open_and_propagate_positions(const ExitStrategy &exit_strategy) {
+    for (const size_t time_idx : this->signal_indices) {
+        PositionPtr position = this->make_position(exit_strategy, time_idx);
+        position->propagate();
+
+        LOG_DEBUG(debug_mode,
+            "Opened and propagated position #%-4zu  [%-5s]  entry: %-8.2f  is_closed: %s",
+            position->start_idx,
+            position->is_long ? "Long" : "Short",
+            position->entry_price,
+            position->is_closed ? "True" : "False"
+        );
+
+        positions.push_back(std::move(position));
+    }
+
+    LOG_DEBUG(debug_mode, "Total positions opened and propagated  Count=%-6zu\n", positions.size());
+
+    this->finalize_positions();
+}
+
+
+void PositionCollection::open_and_propagate_positions_batch(
+    const std::vector<PositionCollection*>& collections,
+    const std::vector<const ExitStrategy*>& exit_strategies)
+{
+    if (collections.size() != exit_strategies.size())
+        throw std::invalid_argument("One exit strategy is required per position collection.");
+
+    if (collections.empty())
+        return;
+
+    const PositionCollection& reference = *collections.front();
+
+    for (const PositionCollection* collection : collections) {
+        if (&collection->market != &reference.market || collection->trade_signal != reference.trade_signal)
+            throw std::invalid_argument("Batched position collections must share the same market and trade signal.");
+
+        if (!collection->positions.empty())
+            throw std::logic_error("Batched position collections must be empty.");
+    }
+
+    for (size_t k = 0; k < collections.size(); k++)
+        collections[k]->open_positions(*exit_strategies[k]);
+
+    // Position p of every collection opens at the same signal index and on the same side, so they all
+    // read the same price window: propagating them back to back pulls the window from memory once and
+    // serves the other strategies from cache.
+    const size_t n_positions = reference.signal_indices.size();
+    std::exception_ptr error = nullptr;
+
+    #pragma omp parallel for schedule(dynamic, 64)
+    for (size_t idx = 0; idx < n_positions; idx++) {
+        try {
+            for (PositionCollection* collection : collections)
+                collection->positions[idx]->propagate();
+        } catch (...) {
+            #pragma omp critical
+            if (!error)
+                error = std::current_exception();
+        }
+    }
+
+    if (error)
+        std::rethrow_exception(error);
+
+    for (PositionCollection* collection : collections)
+        collection->finalize_positions();
+}
+
+
+void PositionCollection::finalize_positions() {
     this->terminate_open_positions();
 
     std::sort(
         this->positions.begin(),
         this->positions.end(),
-        [](const PositionPtr& a, const PositionPtr& b) { return a->start_date < b->start_date; }
+        [](const PositionPtr& a, const PositionPtr& b) { return a->start_idx < b->start_idx; }
     );
 
-    #pragma omp parallel for
+    this->build_columns();
+
     for (PositionPtr& position : this->positions)
         if (position->close_date == position->start_date) {
             position->display();
@@ -135,6 +235,26 @@ void PositionCollection::propagate_positions() {
 }
 
 
+void PositionCollection::build_columns() {
+    const size_t n_positions = this->positions.size();
+
+    this->start_indices.resize(n_positions);
+    this->close_indices.resize(n_positions);
+    this->entry_prices.resize(n_positions);
+    this->exit_prices.resize(n_positions);
+    this->stop_loss_prices.resize(n_positions);
+
+    for (size_t idx = 0; idx < n_positions; idx++) {
+        const BasePosition& position = *this->positions[idx];
+        this->start_indices[idx] = position.start_idx;
+        this->close_indices[idx] = position.close_idx;
+        this->entry_prices[idx] = position.entry_price;
+        this->exit_prices[idx] = position.exit_price;
+        this->stop_loss_prices[idx] = position.exit_strategy->stop_loss_price;
+    }
+}
+
+
 void PositionCollection::terminate_open_positions() {
     for (const auto& position : this->positions) {
         if (!position->is_closed) {
@@ -212,11 +332,17 @@ inline std::vector<BasePosition*> PositionCollection::get_all_positions(size_t c
 }
 
 [[nodiscard]] std::vector<double> PositionCollection::get_entry_prices() {
+    if (this->entry_prices.size() == this->positions.size())
+        return this->entry_prices;
+
     return this->extract_vector(
         [](const PositionPtr& p) { return p->entry_price; });
 }
 
 [[nodiscard]] std::vector<double> PositionCollection::get_exit_prices() {
+    if (this->exit_prices.size() == this->positions.size())
+        return this->exit_prices;
+
     return this->extract_vector(
         [](const PositionPtr& p) { return p->exit_price; });
 }
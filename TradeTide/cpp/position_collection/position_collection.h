@@ -41,18 +41,37 @@ private:
      */
     std::vector<TimePoint> extract_vector(std::function<TimePoint(PositionPtr)> accessor);
 
+    /**
+     * @brief Rebuilds the per-field columns from the current (sorted) positions.
+     */
+    void build_columns();
+
+    /**
+     * @brief Creates the Long or Short position matching the signal value at a given index.
+     */
+    PositionPtr make_position(const ExitStrategy &exit_strategy, const size_t time_idx) const;
+
+    /**
+     * @brief Closes leftovers, sorts positions chronologically and validates them once propagated.
+     */
+    void finalize_positions();
+
 public:
-    const Market market;                             ///< Market data reference
+    const Market& market;                            ///< Market data reference (not copied)
     const std::vector<int> trade_signal;          ///< Signal stream for entry logic
     std::vector<PositionPtr> positions;              ///< All tracked positions
+    std::vector<size_t> signal_indices;              ///< Market indices with a non-zero signal, where positions open
     size_t number_of_trade = 0;                      ///< Number of trades detected from signal
     bool save_price_data = false;                    ///< Whether to store SL/TP traces
-     bool debug_mode = false;  ///< Enable debug output for development purposes
+    bool debug_mode = false;                         ///< Enable debug output for development purposes
 
-    /**
-     * @brief Default constructor.
-     */
-    PositionCollection() = default;
+    // Column view of the propagated positions (same order as `positions`), so the
+    // simulation sweeps read contiguous arrays instead of chasing position pointers.
+    std::vector<size_t> start_indices;               ///< Opening market index of each position
+    std::vector<size_t> close_indices;               ///< Closing market index of each position
+    std::vector<double> entry_prices;                ///< Entry price of each position
+    std::vector<double> exit_prices;                 ///< Exit price of each position
+    std::vector<double> stop_loss_prices;            ///< Final stop-loss level of each position
 
     /**
      * @brief Constructs a new PositionCollection.
@@ -74,6 +93,30 @@ public:
      */
     void propagate_positions();
 
+    /**
+     * @brief Opens and propagates every position in a single sweep over the signal.
+     *
+     * Equivalent to open_positions() followed by propagate_positions(), but each position
+     * is walked forward right after it is created, while its slice of market data is still hot.
+     */
+    void open_and_propagate_positions(const ExitStrategy &exit_strategy);
+
+    /**
+     * @brief Opens and propagates the same signal under several exit strategies at once.
+     *
+     * `collections[k]` receives the positions of `exit_strategies[k]`; all collections must be empty
+     * and share the same market and trade signal. Positions opened at the same signal are propagated
+     * back to back for every strategy, so each price window is read from memory once per batch rather
+     * than once per strategy. Results are identical to calling open_and_propagate_positions on each
+     * collection.
+     *
+     * @param collections     Empty collections to fill, one per exit strategy.
+     * @param exit_strategies Exit strategy templates, one per collection.
+     */
+    static void open_and_propagate_positions_batch(
+        const std::vector<PositionCollection*>& collections,
+        const std::vector<const ExitStrategy*>& exit_strategies);
+
     /**
      * @brief Force-closes any remaining open positions at final market price.
      */
@@ -1,16 +1,25 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/chrono.h>
+#include <pybind11/numpy.h>
 
 #include "record.h"
 
+// Copy a history buffer into a NumPy array in one go. Every simulate() rewrites the buffers, so an
+// array sharing their memory would change, or dangle, under a caller still holding it.
+template <typename T>
+pybind11::array_t<T> record_array(const Record& self, const std::vector<T> Record::*member) {
+    const std::vector<T>& buffer = self.*member;
+    return pybind11::array_t<T>(buffer.size(), buffer.data());
+}
+
 void register_record(pybind11::module_ &module) {
     pybind11::class_<Record>(module, "Record")
         .def_readonly("time", &Record::time)
-        .def_readonly("equity", &Record::equity)
-        .def_readonly("capital", &Record::capital)
-        .def_readonly("concurrent_positions", &Record::concurrent_positions)
-        .def_readonly("capital_at_risk", &Record::capital_at_risk)
+        .def_property_readonly("equity", [](const Record& self) { return record_array(self, &Record::equity); })
+        .def_property_readonly("capital", [](const Record& self) { return record_array(self, &Record::capital); })
+        .def_property_readonly("concurrent_positions", [](const Record& self) { return record_array(self, &Record::concurrent_positions); })
+        .def_property_readonly("capital_at_risk", [](const Record& self) { return record_array(self, &Record::capital_at_risk); })
         .def_readonly("initial_capital", &Record::initial_capital)
         ;
 }
@@ -3,10 +3,11 @@
 
 void Record::start_record(size_t n_element) {
     this->record_enabled = true;
-    this->equity.reserve(n_element);
-    this->capital_at_risk.reserve(n_element);
-    this->concurrent_positions.reserve(n_element);
-    this->time.reserve(n_element);
+    this->equity.assign(n_element, 0.0);
+    this->capital.assign(n_element, 0.0);
+    this->capital_at_risk.assign(n_element, 0.0);
+    this->concurrent_positions.assign(n_element, 0);
+    this->time.assign(n_element, TimePoint{});
 }
 
 
@@ -14,9 +15,11 @@ void Record::update() {
     if (!this->record_enabled) {
         return;
     }
-    this->equity.push_back(this->state->equity);
-    this->capital.push_back(this->state->capital);
-    this->capital_at_risk.push_back(this->state->capital_at_risk);
-    this->concurrent_positions.push_back(this->state->number_of_concurrent_positions);
-    this->time.push_back(this->state->current_date);
+    const size_t idx = this->state->time_idx;
+
+    this->equity[idx] = this->state->equity;
+    this->capital[idx] = this->state->capital;
+    this->capital_at_risk[idx] = this->state->capital_at_risk;
+    this->concurrent_positions[idx] = this->state->number_of_concurrent_positions;
+    this->time[idx] = this->state->current_date;
 }
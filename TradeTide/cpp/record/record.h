@@ -28,13 +28,20 @@ class Record {
         size_t fail_count = 0;                        ///< Number of failed trades
 
         /**
-         * @brief Prepares internal buffers to record state history.
-         * @param n_element Expected number of time steps
+         * @brief Allocates the history buffers once for the whole simulation.
+         *
+         * Each update() then writes in place at the current state's time index.
+         * @param n_element Number of time steps in the simulation
          */
         void start_record(size_t n_element);
 
         /**
-         * @brief Record all current state metrics to history (if recording is enabled).
+         * @brief Record all current state metrics at the state's time index (if recording is enabled).
          */
         void update();
+
+        /**
+         * @brief Whether history buffers were allocated with start_record().
+         */
+        bool is_enabled() const { return this->record_enabled; }
 };
@@ -1,6 +1,7 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/chrono.h>
+#include <pybind11/numpy.h>
 #include "signal.h"
 
 namespace py = pybind11;
@@ -20,7 +21,7 @@ PYBIND11_MODULE(interface_signal, module) {
 
         Useful for backtesting and strategy development.
     )pbdoc")
-        .def(py::init<const Market&>(), py::arg("market"), R"pbdoc(
+        .def(py::init<const Market&>(), py::arg("market"), py::keep_alive<1, 2>(), R"pbdoc(
             Create a new Signal instance associated with a given Market.
 
             Parameters
@@ -110,11 +111,23 @@ PYBIND11_MODULE(interface_signal, module) {
                 Current trade signal vector.
         )pbdoc")
 
-        .def_readonly("market", &Signal::market, R"pbdoc(
+        .def_property_readonly("market", [](const Signal& self) -> const Market& { return self.market; }, py::return_value_policy::reference_internal, R"pbdoc(
             Market instance the signal is aligned with.
         )pbdoc")
 
-        .def_readwrite("trade_signal", &Signal::trade_signal, R"pbdoc(
-            Raw trade signal list: -1 (short), 0 (neutral), 1 (long).
+        .def_property("trade_signal",
+            // Hand out a copy: generate_random() refills the buffer and reallocates it when the market
+            // has grown, which would leave an array sharing its memory dangling.
+            [](const Signal& self) { return py::array_t<int>(self.trade_signal.size(), self.trade_signal.data()); },
+            [](Signal& self, const py::array_t<int, py::array::c_style | py::array::forcecast>& trade_signal) {
+                if (trade_signal.ndim() != 1 || static_cast<size_t>(trade_signal.size()) != self.market.dates.size())
+                    throw std::invalid_argument("trade_signal must be one-dimensional and match the market length.");
+
+                self.trade_signal.assign(trade_signal.data(), trade_signal.data() + trade_signal.size());
+            },
+            R"pbdoc(
+            Raw trade signal: -1 (short), 0 (neutral), 1 (long).
+
+            Returned as a NumPy copy of the signal. Assigning a sequence of the market's length overwrites it.
         )pbdoc");
 }
@@ -7,42 +7,46 @@ Signal::Signal(const Market& market) : market(market) {
     this->trade_signal.resize(market.dates.size(), 0);
 }
 
+template <typename Direction>
+void Signal::fill_random(const double probability, Direction direction) {
+    const size_t n_elements = this->market.dates.size();
+    this->trade_signal.assign(n_elements, 0);
+
+    if (probability <= 0.0)
+        return;
+
+    if (probability >= 1.0) {
+        for (int& value : this->trade_signal)
+            value = direction();
+        return;
+    }
+
+    std::geometric_distribution<size_t> gap(probability);
+
+    for (size_t i = gap(this->rng); i < n_elements;) {
+        this->trade_signal[i] = direction();
+
+        const size_t step = gap(this->rng);
+        if (step >= n_elements - i - 1)
+            break;
+        i += step + 1;
+    }
+}
+
 void Signal::generate_random(const double probability) {
     if (probability < 0.0 || probability > 1.0)
         throw std::invalid_argument("Probability must be between 0.0 and 1.0");
 
-    std::mt19937 rng(std::random_device{}());
-    std::uniform_real_distribution<double> dist(0.0, 1.0);
     std::bernoulli_distribution direction(0.5);
-
-    this->trade_signal.clear();
-    for (size_t i = 0; i < this->market.dates.size(); ++i) {
-        if (dist(rng) < probability)
-            this->trade_signal.push_back(direction(rng) ? 1 : -1);
-        else
-            this->trade_signal.push_back(0);
-
-    }
+    this->fill_random(probability, [&]() { return direction(this->rng) ? 1 : -1; });
 }
 
 void Signal::generate_only_long(const double probability) {
-    std::mt19937 rng(std::random_device{}());
-    std::uniform_real_distribution<double> dist(0.0, 1.0);
-
-    this->trade_signal.clear();
-    for (size_t i = 0; i < this->market.dates.size(); ++i) {
-        this->trade_signal.push_back(dist(rng) < probability ? 1 : 0);
-    }
+    this->fill_random(probability, []() { return 1; });
 }
 
 void Signal::generate_only_short(const double probability) {
-    std::mt19937 rng(std::random_device{}());
-    std::uniform_real_distribution<double> dist(0.0, 1.0);
-
-    this->trade_signal.clear();
-    for (size_t i = 0; i < this->market.dates.size(); ++i) {
-        this->trade_signal.push_back(dist(rng) < probability ? -1 : 0);
-    }
+    this->fill_random(probability, []() { return -1; });
 }
 
 const std::vector<int>& Signal::get_signals() const {
@@ -16,14 +16,24 @@
  * Includes utilities for generation, validation, and export.
  */
 class Signal {
-    public:
-        const Market market;              ///< Market reference with aligned timestamps.
-        std::vector<int> trade_signal;    ///< Trade decisions per timestamp: -1 (short), 0 (neutral), 1 (long)
+    private:
+        std::mt19937 rng{std::random_device{}()};  ///< Generator shared by the random signal builders.
 
         /**
-         * @brief Default constructor for uninitialized signal.
+         * @brief Reset the signal to neutral and fill a random subset of timestamps.
+         *
+         * Gaps between non-zero entries are drawn from a geometric distribution, which is
+         * equivalent to one Bernoulli draw per timestamp but only costs one draw per trade.
+         *
+         * @param probability Probability of a non-zero signal at each time.
+         * @param direction Callable returning the value (1 or -1) to store at a selected time.
          */
-        Signal() = default;
+        template <typename Direction>
+        void fill_random(const double probability, Direction direction);
+
+    public:
+        const Market& market;             ///< Market reference with aligned timestamps (not copied).
+        std::vector<int> trade_signal;    ///< Trade decisions per timestamp: -1 (short), 0 (neutral), 1 (long)
 
         /**
          * @brief Construct signal aligned with given market.
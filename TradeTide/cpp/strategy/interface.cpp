@@ -1,6 +1,7 @@
 #include <sys/types.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <pybind11/numpy.h>
 #include "strategy.h"
 
 
@@ -25,8 +26,12 @@ PYBIND11_MODULE(interface_strategy, module) {
         )
         .def(
             "get_trade_signal",
-            &Strategy::get_trade_signal,
-            pybind11::return_value_policy::reference_internal,
+            [](Strategy& self, const Market& market) {
+                // Hand the signal over to NumPy without copying it element by element into a list.
+                auto* signal = new std::vector<int>(self.get_trade_signal(market));
+                pybind11::capsule owner(signal, [](void* ptr) { delete static_cast<std::vector<int>*>(ptr); });
+                return pybind11::array_t<int>(signal->size(), signal->data(), owner);
+            },
             pybind11::arg("market"),
             R"pbdoc(
                 Get the trade signal based on the current market data.
@@ -37,8 +42,8 @@ PYBIND11_MODULE(interface_strategy, module) {
                     The market data containing prices to analyze.
                 Returns
                 -------
-                List[int]
-                    A vector of integers representing the trade signals from each indicator.
+                numpy.ndarray
+                    Consensus trade signal per market tick (+1 buy, -1 sell, 0 otherwise).
             )pbdoc"
         )
     ;
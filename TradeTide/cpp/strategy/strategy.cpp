@@ -1,18 +1,44 @@
 #include "strategy.h"
 
+#include <exception>
+#include <set>
+
 
 void Strategy::add_indicator(std::shared_ptr<BaseIndicator> indicator) {
     indicators.push_back(std::move(indicator));
 }
 
 std::vector<int> Strategy::get_trade_signal(const Market& market) {
-    std::vector<std::vector<int>> signals;
-
-    for (std::shared_ptr<BaseIndicator>& indicator : this->indicators){
-        indicator->run_with_market(market);
-        signals.push_back(this->get_signal_from_indicator(*indicator));
+    const size_t n_indicators = this->indicators.size();
+    std::vector<std::vector<int>> signals(n_indicators);
+
+    // Indicators only read the shared price series and write their own buffers, so they run side
+    // by side while the prices are in cache. The same instance added twice would share buffers,
+    // in which case they run one after the other.
+    std::set<const BaseIndicator*> distinct;
+    for (const std::shared_ptr<BaseIndicator>& indicator : this->indicators)
+        distinct.insert(indicator.get());
+
+    const bool run_in_parallel = n_indicators > 1 && distinct.size() == n_indicators;
+
+    // Exceptions cannot cross the parallel region, so the first one is kept and rethrown after it.
+    std::exception_ptr error = nullptr;
+
+    #pragma omp parallel for schedule(dynamic, 1) if(run_in_parallel)
+    for (size_t idx = 0; idx < n_indicators; idx++) {
+        try {
+            this->indicators[idx]->run_with_market(market);
+            signals[idx] = this->get_signal_from_indicator(*this->indicators[idx]);
+        } catch (...) {
+            #pragma omp critical
+            if (!error)
+                error = std::current_exception();
+        }
     }
 
+    if (error)
+        std::rethrow_exception(error);
+
     return this->combine_signals(signals);
 }
 
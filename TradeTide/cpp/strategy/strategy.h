@@ -27,6 +27,7 @@ public:
     /**
      * Get the trade signal based on the current market data.
      * This method runs all indicators with the provided market data and computes a consensus signal.
+     * Distinct indicators are run concurrently.
      * @param market The market data containing prices to analyze.
      * @return A vector of integers representing the trade signals from each indicator.
      */
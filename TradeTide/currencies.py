@@ -28,4 +28,8 @@ class Currency(Enum):
     @classmethod
     def list(cls):
         """Return all currency codes as a list of strings."""
-        return [c.value for c in cls]
+        return list(_CURRENCY_CODES)
+
+
+# Members are fixed once the class is created, so the codes are collected a single time
+_CURRENCY_CODES = tuple(currency.value for currency in Currency)
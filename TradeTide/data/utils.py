@@ -2,10 +2,6 @@ import os
 import pandas as pd
 
 
-import os
-import pandas as pd
-
-
 def process_csv_with_spread(input_file, output_file):
     """
     Process a CSV file with metadata and a 'spread' column.
@@ -36,28 +32,22 @@ def process_csv_with_spread(input_file, output_file):
                 break
     metadata_count = len(metadata)
 
-    # Load the CSV data, skipping metadata lines so header is correctly read
-    df = pd.read_csv(input_path, skiprows=metadata_count, parse_dates=["date"])
-
-    # Compute ask (original + spread) and bid (original) columns
+    # Load only the columns we need, skipping metadata lines so header is correctly read
+    df = pd.read_csv(
+        input_path,
+        skiprows=metadata_count,
+        usecols=["date", "open", "high", "low", "close", "spread"],
+        parse_dates=["date"],
+        engine="c",
+    )
+
+    # Build the output frame directly: ask = original + spread, bid = original
+    df_out = pd.DataFrame({"date": df["date"]})
     for col in ["open", "high", "low", "close"]:
-        df[f"ask_{col}"] = df[col] + df["spread"]
-        df[f"bid_{col}"] = df[col]
-
-    # Reorder and select the desired columns
-    df_out = df[
-        [
-            "date",
-            "ask_open",
-            "ask_high",
-            "ask_low",
-            "ask_close",
-            "bid_open",
-            "bid_high",
-            "bid_low",
-            "bid_close",
-        ]
-    ]
+        df_out[f"ask_{col}"] = df[col] + df["spread"]
+    for col in ["open", "high", "low", "close"]:
+        df_out[f"bid_{col}"] = df[col]
+    del df
 
     # Write out the new CSV, including metadata
     with open(output_path, "w") as f:
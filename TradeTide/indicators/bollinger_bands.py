@@ -35,12 +35,9 @@ class BollingerBands(BOLLINGERBANDS, BaseIndicator):
     multiplier: float
 
     def __post_init__(self):
-        window = (
-            self.window.total_seconds()
-            / SimulationSettings().get_time_unit().total_seconds()
-        )
+        window = SimulationSettings().to_ticks(self.window)
 
-        super().__init__(window=int(window), multiplier=self.multiplier)
+        super().__init__(window=window, multiplier=self.multiplier)
 
     @helper.pre_plot(nrows=1, ncols=1)
     def plot(self, axes: plt.Axes, show_metric: bool = False) -> None:
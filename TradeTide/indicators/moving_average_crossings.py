@@ -36,18 +36,13 @@ class MovingAverageCrossing(MOVINGAVERAGECROSSING, BaseIndicator):
     long_window: datetime.timedelta
 
     def __post_init__(self):
-        _short_window = (
-            self.short_window.total_seconds()
-            / SimulationSettings().get_time_unit().total_seconds()
-        )
+        settings = SimulationSettings()
 
-        _long_window = (
-            self.long_window.total_seconds()
-            / SimulationSettings().get_time_unit().total_seconds()
+        super().__init__(
+            short_window=settings.to_ticks(self.short_window),
+            long_window=settings.to_ticks(self.long_window),
         )
 
-        super().__init__(short_window=int(_short_window), long_window=int(_long_window))
-
     @helper.pre_plot(nrows=1, ncols=1)
     def plot(self, axes: plt.Axes) -> None:
         """
@@ -41,19 +41,11 @@ class RelativeMomentumIndex(RELATIVEMOMENTUMINDEX, BaseIndicator):
     over_sold: float = 30.0
 
     def __post_init__(self):
-        _momentum_period = (
-            self.momentum_period.total_seconds()
-            / SimulationSettings().get_time_unit().total_seconds()
-        )
-
-        _smooth_window = (
-            self.smooth_window.total_seconds()
-            / SimulationSettings().get_time_unit().total_seconds()
-        )
+        settings = SimulationSettings()
 
         super().__init__(
-            momentum_period=int(_momentum_period),
-            smooth_period=int(_smooth_window),
+            momentum_period=settings.to_ticks(self.momentum_period),
+            smooth_period=settings.to_ticks(self.smooth_window),
             over_bought=self.over_bought,
             over_sold=self.over_sold,
         )
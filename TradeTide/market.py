@@ -17,6 +17,7 @@ class Market(interface_market.Market):
     def __init__(self):
         self.currency_pair = None
         self.time_span = None
+        self._csv_path = None
         super().__init__()
 
     def _parse_timespan(self, time_span) -> timedelta:
@@ -115,6 +116,34 @@ class Market(interface_market.Market):
         ).with_suffix(".csv")
 
         self.load_from_csv(filename=str(csv_path), time_span=ts)
+        self._csv_path = csv_path
+
+    def append_from_database(self, time_span: Union[str, timedelta]) -> int:
+        """Append the data that follows the currently loaded range.
+
+        Rows of the currency pair file that are already loaded are skipped, so
+        extending a market is much cheaper than reloading a longer time span.
+
+        Args:
+            time_span (Union[str, timedelta]): Amount of new history to append, starting
+                at the first timestamp after the loaded range; may be a `timedelta` or a
+                string like "2d 6h".
+
+        Returns:
+            int: Number of rows appended.
+
+        Raises:
+            RuntimeError: If no data was previously loaded with `load_from_database`.
+        """
+        if self._csv_path is None:
+            raise RuntimeError(
+                "load_from_database must be called before append_from_database."
+            )
+
+        ts = self._parse_timespan(time_span)
+        self.time_span = self.time_span + ts
+
+        return self.extend_from_csv(filename=str(self._csv_path), time_span=ts)
 
     @helper.pre_plot(nrows=1, ncols=1)
     def plot_ask(self, axes: plt.Axes = None) -> None:
@@ -16,7 +16,7 @@ Short = position.Short
 
 
 class Portfolio(PORTFOLIO):
-    def __init__(self, position_collection):
+    def __init__(self, position_collection, save_history: bool = True):
         """
         Initialize the Portfolio with a position collection and optional debug mode.
 
@@ -24,10 +24,14 @@ class Portfolio(PORTFOLIO):
         ----------
         position_collection : PositionCollection
             The collection of positions to manage.
+        save_history : bool, default=True
+            Record equity, capital and exposure at every tick. Metrics and plots need it;
+            disable it for runs that only read the final state.
         """
         super().__init__(
             position_collection=position_collection,
             debug_mode=TradeTide.debug_mode,
+            save_history=save_history,
         )
         self.position_collection = position_collection
 
@@ -48,27 +52,21 @@ class Portfolio(PORTFOLIO):
         max_positions : int or float, default=np.inf
             Maximum number of positions to draw (in chronological order).
         """
-        long_list = []
-        short_list = []
+        # Only the first eleven positions are drawn, keeping the shaded spans readable
+        position_list = self.get_positions(max_positions)[:11]
 
-        position_list = self.get_positions(max_positions)
+        if not position_list:
+            return
 
-        for idx, p in enumerate(position_list):
-            if p.is_long:
-                long_list.append(p)
-            else:
-                short_list.append(p)
+        long_list = [p for p in position_list if p.is_long]
+        short_list = [p for p in position_list if not p.is_long]
 
-            if idx > 10:
-                break
+        # Each panel redraws the full bid series, so build it once with every position in hand
+        axes[0].sharex(axes[1])
 
-            axes[0].sharex(axes[1])
+        self._plot_long_positions(axes=axes[0], position_list=long_list, show=False)
 
-            self._plot_long_positions(axes=axes[0], position_list=long_list, show=False)
-
-            self._plot_short_positions(
-                axes=axes[1], position_list=short_list, show=False
-            )
+        self._plot_short_positions(axes=axes[1], position_list=short_list, show=False)
 
     @helper.pre_plot(nrows=1, ncols=1)
     def _plot_long_positions(
@@ -225,7 +223,7 @@ class Portfolio(PORTFOLIO):
         """
         axes.step(
             self.record.time,
-            self.record.number_of_concurent_positions,
+            self.record.concurrent_positions,
             color="black",
             where="mid",
         )
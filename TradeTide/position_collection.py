@@ -56,6 +56,10 @@ class PositionCollection(POSITIONCOLLECTION):
         axes[1].set_ylabel(f"Bid Price")
         axes[0].set_ylabel(f"Ask Price")
 
+        # Stop-loss and take-profit paths are joined into one line per panel, with a NaN
+        # between positions to break it, instead of adding two artists per position.
+        line_dates, stop_loss_prices, take_profit_prices = [], [], []
+
         for idx in range(min(len(self), max_positions)):
 
             position = self[idx]
@@ -68,21 +72,31 @@ class PositionCollection(POSITIONCOLLECTION):
             # shade the region
             ax.axvspan(start, end, facecolor=fill_color, edgecolor="black", alpha=0.2)
 
-            # SL and TP lines
+            exit_strategy = position.exit_strategy
+            dates = exit_strategy.dates
+            if not dates:
+                continue
+
+            line_dates += dates + dates[-1:]
+            stop_loss_prices += exit_strategy.stop_loss_prices + [np.nan]
+            take_profit_prices += exit_strategy.take_profit_prices + [np.nan]
+
+        # SL and TP lines
+        if line_dates:
             axes[0].plot(
-                position.exit_strategy.dates,
-                position.exit_strategy.stop_loss_prices,
+                line_dates,
+                stop_loss_prices,
                 linestyle="--",
                 color="red",
                 linewidth=1,
             )
 
             axes[1].plot(
-                position.exit_strategy.dates,
-                position.exit_strategy.take_profit_prices,
+                line_dates,
+                take_profit_prices,
                 linestyle="--",
                 color="green",
                 linewidth=1,
             )
 
-            axes[0].get_figure().autofmt_xdate()
+        axes[0].get_figure().autofmt_xdate()
@@ -20,3 +20,7 @@ class SimulationSettings:
 
     def get_time_unit(self) -> timedelta:
         return self.time_unit
+
+    def to_ticks(self, duration: timedelta) -> int:
+        """Convert a duration to a whole number of time units, using exact integer arithmetic."""
+        return duration // self.time_unit
@@ -35,8 +35,7 @@ position_collection = PositionCollection(
     trade_signal=signal.trade_signal,
 )
 
-position_collection.open_positions(exit_strategy=exit_strategy)
-position_collection.propagate_positions()
+position_collection.open_and_propagate_positions(exit_strategy=exit_strategy)
 
 capital_management = capital_management.FixedLot(
     capital=1000000,
@@ -47,9 +47,7 @@ position_collection = PositionCollection(
     trade_signal=strategy.get_trade_signal(market),
 )
 
-position_collection.open_positions(exit_strategy=exit_strategy)
-
-position_collection.propagate_positions()
+position_collection.open_and_propagate_positions(exit_strategy=exit_strategy)
 
 position_collection.display()
 
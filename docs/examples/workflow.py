@@ -114,11 +114,8 @@ position_collection = PositionCollection(
 
 position_collection.plot()
 
-# Open positions based on signals and apply exit strategy
-position_collection.open_positions(exit_strategy=risk_strategy)
-
-# Propagate positions through time to simulate trading
-position_collection.propagate_positions()
+# Open positions based on signals and propagate each one through time until its exit
+position_collection.open_and_propagate_positions(exit_strategy=risk_strategy)
 
 # %%
 # Capital Management Setup
@@ -70,6 +70,9 @@ sphinx_gallery_conf = {
     "capture_repr": ("_repr_html_", "__repr__"),
     "nested_sections": True,
     "within_subsection_order": FileNameSortKey,
+    # Examples are independent scripts: run them in separate worker processes,
+    # using the sphinx-build ``-j`` job count.
+    "parallel": True,
 }
 
 
@@ -13,9 +13,7 @@ This module tests edge cases and expected band computation behavior:
 import pytest
 import numpy as np
 from TradeTide.binary.interface_indicators import BOLLINGERBANDS
-import TradeTide
 
-TradeTide.debug_mode = True  # Enable debug mode for development purpose
 
 # Define constants for window and multiplier
 WINDOW = 3
@@ -39,7 +37,7 @@ def test_run_indicator_lengths():
 
     Checks that SMA, upper, lower, and signals arrays all have the same length as input.
     """
-    prices = [1.0, 2.0, 3.0, 4.0, 5.0]
+    prices = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
     indicator = BOLLINGERBANDS(window=WINDOW, multiplier=MULTIPLIER)
 
     indicator._cpp_run_with_vector(prices)
@@ -49,13 +47,16 @@ def test_run_indicator_lengths():
     assert len(indicator._cpp_lower_band) == len(prices), "Lower band length mismatch"
     assert len(indicator._cpp_regions) == len(prices), "Signals length mismatch"
 
+    with pytest.raises(ValueError):
+        indicator._cpp_run_with_vector(np.ones((2, 3)))
+
 
 def test_band_values_accuracy():
     """
     Validate SMA and band computations against manual calculations.
     """
     # Known sequence
-    prices = [10.0, 20.0, 30.0, 40.0, 50.0]
+    prices = np.array([10.0, 20.0, 30.0, 40.0, 50.0])
     indicator = BOLLINGERBANDS(window=WINDOW, multiplier=MULTIPLIER)
     indicator._cpp_run_with_vector(prices)
 
@@ -75,20 +76,46 @@ def test_band_values_accuracy():
     assert pytest.approx(lower[2], rel=1e-7) == 20.0 - std
 
 
+def test_band_values_match_rolling_reference():
+    """
+    Validate every SMA and band value of a longer series against a vectorised rolling reference.
+    """
+    window = 20
+    rng = np.random.default_rng(0)
+    prices = 1.3 + np.cumsum(rng.normal(0, 1e-4, 2_000))
+
+    indicator = BOLLINGERBANDS(window=window, multiplier=MULTIPLIER)
+    indicator._cpp_run_with_vector(prices)
+
+    # One row per full window, evaluated in bulk rather than one np.std call per index
+    windows = np.lib.stride_tricks.sliding_window_view(prices, window)
+    mean = windows.mean(axis=1)
+    std = windows.std(axis=1, ddof=0)
+
+    sma = np.asarray(indicator._cpp_sma)
+    upper = np.asarray(indicator._cpp_upper_band)
+    lower = np.asarray(indicator._cpp_lower_band)
+
+    assert np.isnan(sma[: window - 1]).all()
+    np.testing.assert_allclose(sma[window - 1 :], mean, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(upper[window - 1 :], mean + MULTIPLIER * std, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(lower[window - 1 :], mean - MULTIPLIER * std, rtol=0, atol=1e-9)
+
+
 def test_sell_signal_on_upper_break():
     """
     Verify that a spike above the upper band generates a sell (-1) signal.
     """
     # Sequence spikes at idx=3
-    prices = [1.0, 1.0, 1.0, 10.0, 1.0, 1.0]
+    prices = np.array([1.0, 1.0, 1.0, 10.0, 1.0, 1.0])
     indicator = BOLLINGERBANDS(window=WINDOW, multiplier=MULTIPLIER)
     indicator._cpp_run_with_vector(prices)
 
-    sig = np.asarray(indicator._cpp_regions).tolist()
+    sig = np.asarray(indicator._cpp_regions)
     # Expect sell at idx=3
     assert sig[3] == -1, "Expected sell signal at index 3"
     # Only one signal
-    assert sum(1 for s in sig if s != 0) == 1, "Only one signal expected"
+    assert np.count_nonzero(sig) == 1, "Only one signal expected"
 
 
 def test_buy_signal_on_lower_break():
@@ -96,15 +123,15 @@ def test_buy_signal_on_lower_break():
     Verify that a dip below the lower band generates a buy (+1) signal.
     """
     # Build a high baseline then dip at idx=3
-    prices = [10.0, 10.0, 10.0, 1.0, 10.0, 10.0]
+    prices = np.array([10.0, 10.0, 10.0, 1.0, 10.0, 10.0])
     indicator = BOLLINGERBANDS(window=WINDOW, multiplier=MULTIPLIER)
     indicator._cpp_run_with_vector(prices)
 
-    sig = np.asarray(indicator._cpp_regions).tolist()
+    sig = np.asarray(indicator._cpp_regions)
     # Expect buy at idx=3
     assert sig[3] == 1, "Expected buy signal at index 3"
     # Only one signal
-    assert sum(1 for s in sig if s != 0) == 1, "Only one signal expected"
+    assert np.count_nonzero(sig) == 1, "Only one signal expected"
 
 
 if __name__ == "__main__":
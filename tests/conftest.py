@@ -0,0 +1,16 @@
+import matplotlib
+import pytest
+
+import TradeTide
+
+# Render every figure off-screen: plotting tests never open a window or need plt.show patched
+matplotlib.use("Agg")
+
+
+@pytest.fixture
+def debug_mode():
+    """Enable TradeTide's debug logging for one test and restore the previous setting afterwards."""
+    previous = TradeTide.debug_mode
+    TradeTide.debug_mode = True
+    yield
+    TradeTide.debug_mode = previous
@@ -0,0 +1,119 @@
+import pytest
+from datetime import timedelta
+
+from TradeTide.market import Market
+from TradeTide.portfolio import Portfolio
+from TradeTide.position_collection import PositionCollection
+from TradeTide.currencies import Currency
+from TradeTide.signal import Signal
+from TradeTide.batch import simulate_grid, exit_strategy_grid
+from TradeTide import capital_management, exit_strategy
+
+
+def test_simulate_grid_matches_individual_runs():
+    """Each grid cell reproduces the stand-alone pipeline on the same market and signal."""
+    market = Market()
+    market.load_from_database(
+        currency_0=Currency.CAD,
+        currency_1=Currency.USD,
+        time_span=timedelta(hours=6),
+    )
+
+    signal = Signal(market=market)
+    signal.generate_random(probability=0.05)
+
+    exit_strategies = exit_strategy_grid(exit_strategy.Static, stop_losses=[4, 8], take_profits=[4, 12])
+    capital_managements = [
+        capital_management.FixedLot(
+            capital=100_000,
+            fixed_lot_size=100,
+            max_capital_at_risk=10_000,
+            max_concurrent_positions=max_positions,
+        )
+        for max_positions in (1, 10)
+    ]
+
+    results = simulate_grid(market, signal.trade_signal, exit_strategies, capital_managements)
+
+    assert len(results) == len(exit_strategies) * len(capital_managements)
+
+    for result in results:
+        position_collection = PositionCollection(market=market, trade_signal=signal.trade_signal)
+        position_collection.open_positions(exit_strategy=result["exit_strategy"])
+        position_collection.propagate_positions()
+
+        portfolio = Portfolio(position_collection=position_collection)
+        portfolio.simulate(capital_management=result["capital_management"])
+
+        assert result["final_equity"] == portfolio.state.equity
+        assert result["final_capital"] == portfolio.state.capital
+
+
+def test_simulate_grid_keeps_positions_per_run():
+    """Portfolios sharing a propagated collection keep the lot sizes of their own capital management."""
+    market = Market()
+    market.load_from_database(
+        currency_0=Currency.CAD,
+        currency_1=Currency.USD,
+        time_span=timedelta(hours=6),
+    )
+
+    signal = Signal(market=market)
+    signal.generate_random(probability=0.05)
+
+    lot_sizes = (100, 500)
+    capital_managements = [
+        capital_management.FixedLot(
+            capital=100_000,
+            fixed_lot_size=lot_size,
+            max_capital_at_risk=1_000_000,
+            max_concurrent_positions=10,
+        )
+        for lot_size in lot_sizes
+    ]
+
+    results = simulate_grid(
+        market, signal.trade_signal, [exit_strategy.Static(stop_loss=4, take_profit=8)], capital_managements
+    )
+
+    for result, lot_size in zip(results, lot_sizes):
+        portfolio = result["portfolio"]
+        assert len(portfolio.selected_indices) > 0
+        assert all(portfolio.lot_sizes[idx] == lot_size for idx in portfolio.selected_indices)
+        assert all(portfolio.closed_positions[idx] for idx in portfolio.selected_indices)
+
+
+def test_batch_propagation_matches_single_runs():
+    """Batched propagation yields the same positions as propagating each strategy on its own."""
+    market = Market()
+    market.load_from_database(
+        currency_0=Currency.CAD,
+        currency_1=Currency.USD,
+        time_span=timedelta(hours=6),
+    )
+
+    signal = Signal(market=market)
+    signal.generate_random(probability=0.05)
+
+    exit_strategies = [
+        exit_strategy.Static(stop_loss=4, take_profit=8),
+        exit_strategy.Trailing(stop_loss=4, take_profit=8),
+        exit_strategy.Static(stop_loss=16, take_profit=4),
+    ]
+
+    batched = [PositionCollection(market=market, trade_signal=signal.trade_signal) for _ in exit_strategies]
+    PositionCollection.open_and_propagate_positions_batch(collections=batched, exit_strategies=exit_strategies)
+
+    for strategy, collection in zip(exit_strategies, batched):
+        single = PositionCollection(market=market, trade_signal=signal.trade_signal)
+        single.open_and_propagate_positions(exit_strategy=strategy)
+
+        assert collection.get_close_dates() == single.get_close_dates()
+        assert list(collection.exit_prices) == list(single.exit_prices)
+
+    with pytest.raises(ValueError):
+        PositionCollection.open_and_propagate_positions_batch(collections=batched[:1], exit_strategies=exit_strategies)
+
+
+if __name__ == "__main__":
+    pytest.main(["-W error", __file__])
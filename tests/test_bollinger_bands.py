@@ -1,19 +1,16 @@
 import gc
+import tracemalloc
 import time
 import pytest
 import numpy as np
 from datetime import datetime, timedelta
-from unittest.mock import patch
 import matplotlib.pyplot as plt
 
 from TradeTide.indicators.bollinger_bands import BollingerBands
 from TradeTide.market import Market
 from TradeTide.times import minutes, hours, days
 from TradeTide.currencies import Currency
-import TradeTide
 
-# Enable debug mode for detailed logging during test execution
-TradeTide.debug_mode = True
 
 # ===============================
 # Test Configuration and Constants
@@ -41,7 +38,7 @@ def indicator():
     return BollingerBands(window=DEFAULT_WINDOW, multiplier=DEFAULT_MULTIPLIER)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_prices():
     """Generate sample price data for testing various market scenarios.
 
@@ -81,7 +78,7 @@ def sample_prices():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def trending_up_prices():
     """Generate consistently upward trending price data for bullish market testing.
 
@@ -90,10 +87,10 @@ def trending_up_prices():
     numpy.ndarray
         Array of steadily increasing prices that simulate a strong bullish market trend for testing band expansion and price breakout scenarios.
     """
-    return np.array([100.0 + i * 0.5 for i in range(30)])
+    return 100.0 + 0.5 * np.arange(30, dtype=np.float64)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def trending_down_prices():
     """Generate consistently downward trending price data for bearish market testing.
 
@@ -102,10 +99,10 @@ def trending_down_prices():
     numpy.ndarray
         Array of steadily decreasing prices that simulate a strong bearish market trend for testing band contraction and price breakdown scenarios.
     """
-    return np.array([130.0 - i * 0.5 for i in range(30)])
+    return 130.0 - 0.5 * np.arange(30, dtype=np.float64)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def volatile_prices():
     """Generate highly volatile price data for stress testing indicator stability.
 
@@ -114,12 +111,13 @@ def volatile_prices():
     numpy.ndarray
         Array of highly volatile prices with significant fluctuations that test the indicator's ability to handle extreme market conditions and band expansion/contraction.
     """
-    base_prices = np.array([100.0 + i * 0.1 for i in range(50)])
-    noise = np.random.normal(0, 5.0, 50)  # Higher volatility for band testing
+    rng = np.random.default_rng(0)
+    base_prices = 100.0 + 0.1 * np.arange(50, dtype=np.float64)
+    noise = rng.normal(0, 5.0, 50)  # Higher volatility for band testing
     return base_prices + noise
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sideways_prices():
     """Generate sideways price data for range-bound market testing.
 
@@ -128,10 +126,10 @@ def sideways_prices():
     numpy.ndarray
         Array of prices that oscillate within a tight range to test band behavior in consolidating markets.
     """
-    return np.array([100.0 + 2.0 * np.sin(i * 0.2) for i in range(40)])
+    return 100.0 + 2.0 * np.sin(0.2 * np.arange(40))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_market():
     """Create a sample Market object with realistic price data for integration testing.
 
@@ -141,26 +139,40 @@ def sample_market():
         A Market instance populated with sample date/price data that provides a realistic testing environment for indicator integration and end-to-end functionality validation.
     """
     dates = [DEFAULT_START_DATE + i * minutes for i in range(100)]
-    prices = [100.0 + np.sin(i * 0.1) * 10 + np.random.normal(0, 1) for i in range(100)]
+    noise = np.random.default_rng(0).normal(0, 1, 100)
+    prices = 100.0 + np.sin(np.arange(100) * 0.1) * 10 + noise
+    ask_price = np.abs(prices) * 1.001
+    bid_price = np.abs(prices) * 0.999
+
     market = Market()
-    for date, price in zip(dates, prices):
-        ask_price = abs(price) * 1.001
-        bid_price = abs(price) * 0.999
-
-        market.add_market_data(
-            timestamp=date,
-            ask_open=ask_price,
-            ask_high=ask_price,
-            ask_low=ask_price,
-            ask_close=ask_price,
-            bid_open=bid_price,
-            bid_high=bid_price,
-            bid_low=bid_price,
-            bid_close=bid_price,
-        )
+    market.add_market_arrays(
+        timestamps=dates,
+        ask_open=ask_price,
+        ask_high=ask_price,
+        ask_low=ask_price,
+        ask_close=ask_price,
+        bid_open=bid_price,
+        bid_high=bid_price,
+        bid_low=bid_price,
+        bid_close=bid_price,
+    )
     return market
 
 
+@pytest.fixture(scope="module")
+def unit_multiplier_bands(sample_market):
+    """Upper and lower bands of a 10-minute, multiplier 1.0 BollingerBands run on the sample market.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Upper and lower band arrays, computed once and shared by the multiplier comparison cases.
+    """
+    indicator = BollingerBands(window=10 * minutes, multiplier=1.0)
+    indicator.run(sample_market)
+    return np.asarray(indicator._cpp_upper_band), np.asarray(indicator._cpp_lower_band)
+
+
 # ===============================
 # Core Functionality Tests
 # ===============================
@@ -301,10 +313,9 @@ def test_band_expansion_in_volatile_market(volatile_prices):
     """
     # Create market with volatile prices
     dates = [DEFAULT_START_DATE + i * minutes for i in range(len(volatile_prices))]
+    prices = np.abs(volatile_prices)  # Ensure positive prices
     market = Market()
-    for date, price in zip(dates, volatile_prices):
-        price = abs(price)  # Ensure positive prices
-        market.add_tick(timestamp=date, ask_price=price + 0.01, bid_price=price - 0.01)
+    market.add_ticks(timestamps=dates, ask_prices=prices + 0.01, bid_prices=prices - 0.01)
 
     indicator = BollingerBands(window=10 * minutes, multiplier=2.0)
     indicator.run(market)
@@ -334,10 +345,9 @@ def test_band_contraction_in_sideways_market(sideways_prices):
         Sideways price data for band contraction testing.
     """
     dates = [DEFAULT_START_DATE + i * minutes for i in range(len(sideways_prices))]
+    prices = np.abs(sideways_prices)  # Ensure positive prices
     market = Market()
-    for date, price in zip(dates, sideways_prices):
-        price = abs(price)  # Ensure positive prices
-        market.add_tick(timestamp=date, ask_price=price + 0.01, bid_price=price - 0.01)
+    market.add_ticks(timestamps=dates, ask_prices=prices + 0.01, bid_prices=prices - 0.01)
 
     indicator = BollingerBands(window=10 * minutes, multiplier=2.0)
     indicator.run(market)
@@ -362,10 +372,13 @@ def test_edge_case_insufficient_data():
     """Test handling of edge case where market data is insufficient for computing Bollinger Bands ensuring graceful handling of boundary conditions and appropriate behavior when data length is less than required window size."""
     # Create market with fewer data points than window requires
     short_dates = [DEFAULT_START_DATE + i * minutes for i in range(5)]
-    short_prices = [100.0, 101.0, 102.0, 103.0, 104.0]
+    short_prices = np.array([100.0, 101.0, 102.0, 103.0, 104.0])
     market = Market()
-    for date, price in zip(short_dates, short_prices):
-        market.add_tick(timestamp=date, ask_price=price + 0.01, bid_price=price - 0.01)
+    market.add_ticks(
+        timestamps=short_dates,
+        ask_prices=short_prices + 0.01,
+        bid_prices=short_prices - 0.01,
+    )
 
     indicator = BollingerBands(window=DEFAULT_WINDOW, multiplier=DEFAULT_MULTIPLIER)
     # Should handle insufficient data gracefully without crashing
@@ -386,13 +399,15 @@ def test_edge_case_insufficient_data():
 
 
 @pytest.mark.parametrize("multiplier", [1.0, 1.5, 2.0, 2.5, 3.0])
-def test_different_multiplier_values(sample_market, multiplier):
+def test_different_multiplier_values(sample_market, unit_multiplier_bands, multiplier):
     """Test BollingerBands behavior with different standard deviation multiplier values ensuring proper band width scaling and correct mathematical relationships for various multiplier settings.
 
     Parameters
     ----------
     sample_market : Market
         Sample market fixture for multiplier testing.
+    unit_multiplier_bands : tuple of numpy.ndarray
+        Upper and lower bands for multiplier 1.0 on the same market, used as the width reference.
     multiplier : float
         Standard deviation multiplier value for testing.
     """
@@ -413,10 +428,7 @@ def test_different_multiplier_values(sample_market, multiplier):
 
         # Larger multipliers should produce wider bands
         if multiplier >= 2.0:
-            indicator_small = BollingerBands(window=10 * minutes, multiplier=1.0)
-            indicator_small.run(sample_market)
-            small_upper = np.asarray(indicator_small._cpp_upper_band)
-            small_lower = np.asarray(indicator_small._cpp_lower_band)
+            small_upper, small_lower = unit_multiplier_bands
             small_band_width = np.mean((small_upper - small_lower)[valid_mask])
             assert (
                 band_width > small_band_width
@@ -435,9 +447,10 @@ def test_signal_generation(sample_market):
     indicator.run(sample_market)
 
     regions = np.asarray(indicator._cpp_regions)
-    # Check that signals are generated (can be positive, negative, or zero)
-    unique_signals = np.unique(regions)
-    assert len(unique_signals) >= 1, "Should generate at least some signal values"
+    # Check that a signal is generated for every tick (can be positive, negative, or zero)
+    assert len(regions) == len(
+        sample_market.dates
+    ), "Should generate one signal value per market tick"
 
     # All signal values should be within reasonable range
     assert np.all(
@@ -458,9 +471,8 @@ def test_plot_method_execution(sample_market):
 
     # Test plot method execution (requires matplotlib)
     try:
-        with patch("matplotlib.pyplot.show"):  # Mock plt.show to prevent display
-            figure = indicator.plot(show=False)
-            assert isinstance(figure, plt.Figure), "Plot should return a figure object"
+        figure = indicator.plot(show=False)
+        assert isinstance(figure, plt.Figure), "Plot should return a figure object"
     except ImportError:
         pytest.skip("Matplotlib not available for plotting tests")
     except Exception as e:
@@ -470,14 +482,17 @@ def test_plot_method_execution(sample_market):
 def test_performance_with_large_dataset():
     """Test performance characteristics with large datasets ensuring acceptable computation times for enterprise-scale market data processing and memory usage optimization validation under high-volume scenarios."""
     # Create large dataset for performance testing
-    large_dates = [DEFAULT_START_DATE + i * minutes for i in range(10000)]
-    large_prices = [
-        100.0 + np.sin(i * 0.001) * 10 + np.random.normal(0, 0.5) for i in range(10000)
-    ]
+    large_dates = np.datetime64(DEFAULT_START_DATE) + np.arange(10000) * np.timedelta64(1, "m")
+    rng = np.random.default_rng(0)
+    large_prices = np.abs(
+        100.0 + np.sin(np.arange(10000) * 0.001) * 10 + rng.normal(0, 0.5, 10000)
+    )
     market = Market()
-    for date, price in zip(large_dates, large_prices):
-        price = abs(price)
-        market.add_tick(timestamp=date, ask_price=price + 0.01, bid_price=price - 0.01)
+    market.add_ticks(
+        timestamps=large_dates,
+        ask_prices=large_prices + 0.01,
+        bid_prices=large_prices - 0.01,
+    )
 
     indicator = BollingerBands(window=DEFAULT_WINDOW, multiplier=DEFAULT_MULTIPLIER)
 
@@ -496,32 +511,35 @@ def test_performance_with_large_dataset():
 
 def test_memory_usage_and_cleanup():
     """Test memory usage patterns and garbage collection effectiveness ensuring proper cleanup of resources after indicator computation and verification of memory leak prevention in repeated execution scenarios."""
-    initial_objects = len(gc.get_objects())
+    # Build the market once: only the indicator life cycle is under test
+    dates = [DEFAULT_START_DATE + j * minutes for j in range(100)]
+    prices = np.abs(np.random.default_rng(0).normal(100.0, 1.0, 100))
+    market = Market()
+    market.add_ticks(
+        timestamps=dates, ask_prices=prices + 0.01, bid_prices=prices - 0.01
+    )
 
-    # Create and run multiple indicators to test memory management
-    for i in range(50):
-        dates = [DEFAULT_START_DATE + j * minutes for j in range(100)]
-        prices = [100.0 + np.random.normal(0, 1) for _ in range(100)]
-        market = Market()
-        for date, price in zip(dates, prices):
-            price = abs(price)
-            market.add_tick(
-                timestamp=date, ask_price=price + 0.01, bid_price=price - 0.01
-            )
+    n_iterations = 50
+
+    tracemalloc.start()
+    initial_memory, _ = tracemalloc.get_traced_memory()
 
+    # Create and run multiple indicators to test memory management
+    for i in range(n_iterations):
         indicator = BollingerBands(window=DEFAULT_WINDOW, multiplier=DEFAULT_MULTIPLIER)
         indicator.run(market)
-        del indicator, market
+        del indicator
 
     # Force garbage collection
     gc.collect()
-    final_objects = len(gc.get_objects())
+    final_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
 
-    # Memory usage should not grow excessively
-    object_growth = final_objects - initial_objects
+    # A leaked indicator keeps a few hundred bytes of Python objects alive per iteration
+    memory_growth = final_memory - initial_memory
     assert (
-        object_growth < 1000
-    ), f"Excessive object growth: {object_growth} new objects remain"
+        memory_growth < 100 * n_iterations
+    ), f"Excessive memory growth: {memory_growth} bytes remain after {n_iterations} iterations"
 
 
 @pytest.mark.parametrize("frequency", [1, 5, 15, 60])
@@ -536,10 +554,9 @@ def test_different_market_data_frequencies(frequency):
     # Create market data with specified frequency
     time_delta = timedelta(minutes=frequency)
     dates = [DEFAULT_START_DATE + i * time_delta for i in range(50)]
-    prices = [100.0 + np.sin(i * 0.1) * 5 for i in range(50)]
+    prices = 100.0 + np.sin(np.arange(50) * 0.1) * 5
     market = Market()
-    for date, price in zip(dates, prices):
-        market.add_tick(timestamp=date, ask_price=price + 0.01, bid_price=price - 0.01)
+    market.add_ticks(timestamps=dates, ask_prices=prices + 0.01, bid_prices=prices - 0.01)
 
     # Adjust window size based on frequency
     window = max(10 * time_delta, 10 * minutes)
@@ -558,41 +575,50 @@ def test_different_market_data_frequencies(frequency):
     ), f"Output length mismatch for {frequency}min frequency"
 
 
-def test_numerical_stability_extreme_values():
-    """Test indicator handling of extreme price values ensuring numerical stability and accuracy across wide value ranges including very small, very large, and edge case pricing scenarios."""
-    extreme_test_cases = [
-        ([0.0001, 0.0002, 0.0003, 0.0004, 0.0005], "very small prices"),
-        ([10000.0, 20000.0, 30000.0, 40000.0, 50000.0], "very large prices"),
-        ([100.0, 100.0, 100.0, 100.0, 100.0], "constant prices"),
-    ]
+extreme_test_cases = [
+    pytest.param([0.0001, 0.0002, 0.0003, 0.0004, 0.0005], "very small prices", id="small"),
+    pytest.param([10000.0, 20000.0, 30000.0, 40000.0, 50000.0], "very large prices", id="large"),
+    pytest.param([100.0, 100.0, 100.0, 100.0, 100.0], "constant prices", id="constant"),
+]
 
-    for prices, description in extreme_test_cases:
-        dates = [DEFAULT_START_DATE + i * minutes for i in range(len(prices))]
-        market = Market()
-        for date, price in zip(dates, prices):
-            market.add_tick(
-                timestamp=date, ask_price=price + 0.01, bid_price=price - 0.01
-            )
 
-        indicator = BollingerBands(window=3 * minutes, multiplier=2.0)
-        indicator.run(market)
+@pytest.mark.parametrize("prices, description", extreme_test_cases)
+def test_numerical_stability_extreme_values(prices, description):
+    """Test indicator handling of extreme price values ensuring numerical stability and accuracy across wide value ranges including very small, very large, and edge case pricing scenarios.
 
-        sma = np.asarray(indicator._cpp_sma)
-        upper_band = np.asarray(indicator._cpp_upper_band)
-        lower_band = np.asarray(indicator._cpp_lower_band)
-
-        # Check for numerical stability (no NaN or infinite values in valid range)
-        valid_mask = ~np.isnan(sma)
-        if np.sum(valid_mask) > 0:
-            assert not np.any(
-                np.isinf(sma[valid_mask])
-            ), f"SMA should not contain infinite values for {description}"
-            assert not np.any(
-                np.isinf(upper_band[valid_mask])
-            ), f"Upper band should not contain infinite values for {description}"
-            assert not np.any(
-                np.isinf(lower_band[valid_mask])
-            ), f"Lower band should not contain infinite values for {description}"
+    Parameters
+    ----------
+    prices : list of float
+        Price sequence with extreme magnitude or no variation.
+    description : str
+        Human-readable name of the case, used in assertion messages.
+    """
+    dates = [DEFAULT_START_DATE + i * minutes for i in range(len(prices))]
+    prices = np.asarray(prices)
+    market = Market()
+    market.add_ticks(
+        timestamps=dates, ask_prices=prices + 0.01, bid_prices=prices - 0.01
+    )
+
+    indicator = BollingerBands(window=3 * minutes, multiplier=2.0)
+    indicator.run(market)
+
+    sma = np.asarray(indicator._cpp_sma)
+    upper_band = np.asarray(indicator._cpp_upper_band)
+    lower_band = np.asarray(indicator._cpp_lower_band)
+
+    # Check for numerical stability (no NaN or infinite values in valid range)
+    valid_mask = ~np.isnan(sma)
+    if np.sum(valid_mask) > 0:
+        assert not np.any(
+            np.isinf(sma[valid_mask])
+        ), f"SMA should not contain infinite values for {description}"
+        assert not np.any(
+            np.isinf(upper_band[valid_mask])
+        ), f"Upper band should not contain infinite values for {description}"
+        assert not np.any(
+            np.isinf(lower_band[valid_mask])
+        ), f"Lower band should not contain infinite values for {description}"
 
 
 # ===============================
@@ -13,80 +13,85 @@ and comprehensive coverage of enum functionality.
 
 import pytest
 from enum import Enum
+from itertools import permutations
 
 from TradeTide.currencies import Currency
 
 
+# Currency codes the enum is expected to define, written out independently of it
+CURRENCY_CODES = (
+    "USD",
+    "EUR",
+    "GBP",
+    "JPY",
+    "AUD",
+    "CAD",
+    "CHF",
+    "CNY",
+    "NZD",
+    "SEK",
+    "MXN",
+    "SGD",
+    "HKD",
+    "NOK",
+    "KRW",
+    "TRY",
+    "INR",
+    "RUB",
+    "ZAR",
+    "BRL",
+)
+
+
 # ------------------------------------------------------------------------------
 # Test Fixtures
 # ------------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def all_currency_codes():
     """
     Fixture providing all valid currency codes.
 
     Returns
     -------
-    list of str
-        List of all valid currency code strings
+    tuple of str
+        Tuple of all valid currency code strings
     """
-    return [
-        "USD",
-        "EUR",
-        "GBP",
-        "JPY",
-        "AUD",
-        "CAD",
-        "CHF",
-        "CNY",
-        "NZD",
-        "SEK",
-        "MXN",
-        "SGD",
-        "HKD",
-        "NOK",
-        "KRW",
-        "TRY",
-        "INR",
-        "RUB",
-        "ZAR",
-        "BRL",
-    ]
-
-
-@pytest.fixture
+    return CURRENCY_CODES
+
+
+@pytest.fixture(scope="session")
 def major_currencies():
     """
     Fixture providing major currency pairs for trading.
 
     Returns
     -------
-    list of Currency
-        List of major Currency enum instances
+    tuple of Currency
+        Tuple of major Currency enum instances
     """
-    return [Currency.USD, Currency.EUR, Currency.GBP, Currency.JPY]
+    return (Currency.USD, Currency.EUR, Currency.GBP, Currency.JPY)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_currency_pairs():
     """
     Fixture providing sample currency pairs for testing.
 
     Returns
     -------
-    list of tuple
-        List of (base_currency, quote_currency) tuples
+    tuple of tuple
+        Tuple of (base_currency, quote_currency) tuples
     """
-    return [
+    return (
         (Currency.EUR, Currency.USD),
         (Currency.GBP, Currency.USD),
         (Currency.USD, Currency.JPY),
         (Currency.AUD, Currency.USD),
         (Currency.USD, Currency.CAD),
         (Currency.USD, Currency.CHF),
-    ]
+    )
 
 
 # ------------------------------------------------------------------------------
@@ -94,7 +99,7 @@ def sample_currency_pairs():
 # ------------------------------------------------------------------------------
 
 
-class TestCurrencyBasics:
+class Test_CurrencyBasics:
     """Test suite for basic Currency enum functionality."""
 
     def test_currency_enum_inheritance(self):
@@ -103,31 +108,7 @@ class TestCurrencyBasics:
         assert isinstance(Currency.USD, Currency)
         assert isinstance(Currency.EUR, Enum)
 
-    @pytest.mark.parametrize(
-        "currency_code",
-        [
-            "USD",
-            "EUR",
-            "GBP",
-            "JPY",
-            "AUD",
-            "CAD",
-            "CHF",
-            "CNY",
-            "NZD",
-            "SEK",
-            "MXN",
-            "SGD",
-            "HKD",
-            "NOK",
-            "KRW",
-            "TRY",
-            "INR",
-            "RUB",
-            "ZAR",
-            "BRL",
-        ],
-    )
+    @pytest.mark.parametrize("currency_code", CURRENCY_CODES)
     def test_currency_access_by_name(self, currency_code):
         """
         Test that currencies can be accessed by name.
@@ -141,31 +122,7 @@ class TestCurrencyBasics:
         assert isinstance(currency, Currency)
         assert currency.value == currency_code
 
-    @pytest.mark.parametrize(
-        "currency_code",
-        [
-            "USD",
-            "EUR",
-            "GBP",
-            "JPY",
-            "AUD",
-            "CAD",
-            "CHF",
-            "CNY",
-            "NZD",
-            "SEK",
-            "MXN",
-            "SGD",
-            "HKD",
-            "NOK",
-            "KRW",
-            "TRY",
-            "INR",
-            "RUB",
-            "ZAR",
-            "BRL",
-        ],
-    )
+    @pytest.mark.parametrize("currency_code", CURRENCY_CODES)
     def test_currency_access_by_value(self, currency_code):
         """
         Test that currencies can be accessed by value.
@@ -178,6 +135,7 @@ class TestCurrencyBasics:
         currency = Currency(currency_code)
         assert isinstance(currency, Currency)
         assert currency.value == currency_code
+        assert currency is getattr(Currency, currency_code)
 
     def test_currency_string_representation(self):
         """Test string representation of Currency instances."""
@@ -245,7 +203,7 @@ class TestCurrencyBasics:
 # ------------------------------------------------------------------------------
 
 
-class TestCurrencyListMethod:
+class Test_CurrencyListMethod:
     """Test suite for the Currency.list() class method."""
 
     def test_list_method_returns_all_currencies(self, all_currency_codes):
@@ -314,7 +272,7 @@ class TestCurrencyListMethod:
 # ------------------------------------------------------------------------------
 
 
-class TestCurrencyValidation:
+class Test_CurrencyValidation:
     """Test suite for Currency validation and error handling."""
 
     @pytest.mark.parametrize(
@@ -368,7 +326,7 @@ class TestCurrencyValidation:
 # ------------------------------------------------------------------------------
 
 
-class TestCurrencyPracticalUsage:
+class Test_CurrencyPracticalUsage:
     """Test suite for practical usage scenarios."""
 
     def test_currency_pair_creation(self, sample_currency_pairs):
@@ -377,8 +335,8 @@ class TestCurrencyPracticalUsage:
 
         Parameters
         ----------
-        sample_currency_pairs : list
-            List of (base, quote) currency pairs
+        sample_currency_pairs : tuple
+            Tuple of (base, quote) currency pairs
         """
         for base, quote in sample_currency_pairs:
             assert isinstance(base, Currency)
@@ -395,16 +353,12 @@ class TestCurrencyPracticalUsage:
 
         Parameters
         ----------
-        major_currencies : list
-            List of major Currency instances
+        major_currencies : tuple
+            Tuple of major Currency instances
         """
-        conversion_rates = {}
-
-        for base in major_currencies:
-            for quote in major_currencies:
-                if base != quote:
-                    pair = (base, quote)
-                    conversion_rates[pair] = 1.0  # Dummy rate
+        conversion_rates = {
+            pair: 1.0 for pair in permutations(major_currencies, 2)  # Dummy rate
+        }
 
         # Should have rates for all pairs except self-pairs
         expected_pairs = len(major_currencies) * (len(major_currencies) - 1)
@@ -420,14 +374,14 @@ class TestCurrencyPracticalUsage:
 
         Parameters
         ----------
-        all_currency_codes : list
-            List of all currency codes
+        all_currency_codes : tuple
+            Tuple of all currency codes
         """
         # Create portfolio allocation
-        portfolio = {}
-        for i, code in enumerate(all_currency_codes[:5]):  # Use first 5 currencies
-            currency = Currency(code)
-            portfolio[currency] = (i + 1) * 1000  # Dummy allocation
+        portfolio = {
+            Currency(code): (i + 1) * 1000  # Dummy allocation
+            for i, code in enumerate(all_currency_codes[:5])  # Use first 5 currencies
+        }
 
         # Test portfolio operations
         total_allocation = sum(portfolio.values())
@@ -444,8 +398,8 @@ class TestCurrencyPracticalUsage:
 
         Parameters
         ----------
-        all_currency_codes : list
-            List of all currency codes
+        all_currency_codes : tuple
+            Tuple of all currency codes
         """
         # Group by regions (simplified example)
         european_codes = ["EUR", "GBP", "CHF", "SEK", "NOK"]
@@ -473,7 +427,7 @@ class TestCurrencyPracticalUsage:
 # ------------------------------------------------------------------------------
 
 
-class TestCurrencyCompleteness:
+class Test_CurrencyCompleteness:
     """Test suite for ensuring Currency enum completeness."""
 
     def test_major_world_currencies_present(self):
@@ -535,47 +489,43 @@ class TestCurrencyCompleteness:
 # ------------------------------------------------------------------------------
 
 
-class TestCurrencyPerformanceAndEdgeCases:
+class Test_CurrencyPerformanceAndEdgeCases:
     """Performance and edge case tests for Currency enum."""
 
     def test_currency_access_performance(self):
         """Test performance of currency access operations."""
-        import time
+        import timeit
 
-        currency_codes = Currency.list()
+        currency_codes = Currency.list()[:10]  # Test with first 10 currencies
 
-        # Test enum member access performance
-        start_time = time.time()
-        for _ in range(1000):
-            for code in currency_codes[:10]:  # Test with first 10 currencies
-                currency = Currency(code)
-                _ = currency.value
-        end_time = time.time()
+        # Best of several 1000-call rounds, so a busy machine does not fail the test
+        elapsed = min(
+            timeit.repeat(
+                lambda: [Currency(code).value for code in currency_codes],
+                number=1000,
+                repeat=5,
+            )
+        )
 
         # Should complete quickly
-        assert end_time - start_time < 1.0, "Currency access too slow"
+        assert elapsed < 1.0, f"Currency access too slow: {elapsed:.3f}s per 1000 rounds"
 
     def test_currency_list_performance(self):
         """Test performance of Currency.list() method."""
-        import time
+        import timeit
 
-        start_time = time.time()
-        for _ in range(1000):
-            currency_list = Currency.list()
-        end_time = time.time()
+        # Best of several 1000-call rounds, so a busy machine does not fail the test
+        elapsed = min(timeit.repeat(Currency.list, number=1000, repeat=5))
 
         # Should complete quickly
-        assert end_time - start_time < 1.0, "Currency.list() too slow"
+        assert elapsed < 1.0, f"Currency.list() too slow: {elapsed:.3f}s per 1000 calls"
 
     def test_memory_usage_with_many_instances(self):
         """Test memory behavior with many Currency instances."""
-        # Create many instances of the same currency
-        currencies = [Currency.USD for _ in range(1000)]
-
-        # All should be the same object (enum singleton behavior)
-        first_currency = currencies[0]
-        for currency in currencies:
-            assert currency is first_currency, "Currency instances should be singletons"
+        # Every access route yields the same object (enum singleton behavior)
+        assert (
+            Currency("USD") is Currency.USD is Currency["USD"]
+        ), "Currency instances should be singletons"
 
     def test_currency_with_special_scenarios(self):
         """Test Currency behavior in special scenarios."""
@@ -589,15 +539,20 @@ class TestCurrencyPerformanceAndEdgeCases:
             assert currency.value in Currency.list()
 
     def test_currency_pickle_serialization(self):
-        """Test that Currency instances can be pickled/unpickled."""
+        """Test that Currency instances can be pickled/unpickled and deep-copied."""
+        import copy
         import pickle
 
         original = Currency.USD
-        pickled = pickle.dumps(original)
-        unpickled = pickle.loads(pickled)
 
-        assert unpickled == original
-        assert unpickled is original  # Should be the same object
+        # Every protocol must resolve back to the member itself
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(original, protocol=protocol))
+
+            assert unpickled == original
+            assert unpickled is original  # Should be the same object
+
+        assert copy.deepcopy(original) is original
 
     def test_currency_json_serialization_preparation(self):
         """Test preparing Currency for JSON serialization."""
@@ -14,9 +14,6 @@ from TradeTide.position_collection import PositionCollection
 from TradeTide import capital_management, exit_strategy
 from TradeTide.portfolio import Portfolio
 from TradeTide.currencies import Currency
-import TradeTide
-
-TradeTide.debug_mode = True  # Enable debug mode for development purpose
 
 
 # ------------------------------------------------------------------------------
@@ -24,7 +21,7 @@ TradeTide.debug_mode = True  # Enable debug mode for development purpose
 # ------------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def setup_market():
     """Fixture to load a small slice of market data."""
     market = Market()
@@ -36,7 +33,7 @@ def setup_market():
     return market
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def setup_signal(setup_market):
     """Fixture to generate random signals on the loaded market."""
     signal = Signal(market=setup_market)
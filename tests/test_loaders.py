@@ -31,14 +31,12 @@ Currency : Currency enumeration for supported currencies
 
 import pytest
 import numpy as np
+from datetime import datetime
 
 from TradeTide.currencies import Currency
 from TradeTide.market import Market
 from TradeTide.times import days, hours, weeks
-import TradeTide
 
-# Enable debug mode for detailed logging during test execution
-TradeTide.debug_mode = True
 
 # ===============================
 # Test Configuration and Fixtures
@@ -71,7 +69,7 @@ TIME_SPANS = [
 ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_market():
     """
     Create a sample market for testing basic functionality.
@@ -94,7 +92,7 @@ def sample_market():
     return market
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def large_market():
     """
     Create a large market dataset for performance testing.
@@ -312,34 +310,23 @@ def test_data_integrity_validation(sample_market):
     sample_market : Market
         Market fixture with loaded data
     """
-    # Test OHLC relationships for ask prices
-    for i in range(len(sample_market.ask.dates)):
-        open_price = sample_market.ask.open[i]
-        high_price = sample_market.ask.high[i]
-        low_price = sample_market.ask.low[i]
-        close_price = sample_market.ask.close[i]
+    for side, prices in (("Ask", sample_market.ask), ("Bid", sample_market.bid)):
+        # Convert each column once and compare whole arrays instead of per-row floats
+        open_price = np.asarray(prices.open, dtype=np.float64)
+        high_price = np.asarray(prices.high, dtype=np.float64)
+        low_price = np.asarray(prices.low, dtype=np.float64)
+        close_price = np.asarray(prices.close, dtype=np.float64)
 
         # High should be highest, low should be lowest
-        assert high_price >= max(
-            open_price, close_price
-        ), f"Ask high price validation failed at index {i}"
-        assert low_price <= min(
-            open_price, close_price
-        ), f"Ask low price validation failed at index {i}"
-
-    # Test OHLC relationships for bid prices
-    for i in range(len(sample_market.bid.dates)):
-        open_price = sample_market.bid.open[i]
-        high_price = sample_market.bid.high[i]
-        low_price = sample_market.bid.low[i]
-        close_price = sample_market.bid.close[i]
-
-        assert high_price >= max(
-            open_price, close_price
-        ), f"Bid high price validation failed at index {i}"
-        assert low_price <= min(
-            open_price, close_price
-        ), f"Bid low price validation failed at index {i}"
+        valid_high = high_price >= np.maximum(open_price, close_price)
+        assert (
+            valid_high.all()
+        ), f"{side} high price validation failed at index {np.argmin(valid_high)}"
+
+        valid_low = low_price <= np.minimum(open_price, close_price)
+        assert (
+            valid_low.all()
+        ), f"{side} low price validation failed at index {np.argmin(valid_low)}"
 
 
 def test_bid_ask_spread_validation(sample_market):
@@ -354,23 +341,28 @@ def test_bid_ask_spread_validation(sample_market):
     sample_market : Market
         Market fixture with loaded data
     """
-    for i in range(len(sample_market.dates)):
-        ask_price = sample_market.ask.close[i]
-        bid_price = sample_market.bid.close[i]
+    ask_price = np.asarray(sample_market.ask.close, dtype=np.float64)
+    bid_price = np.asarray(sample_market.bid.close, dtype=np.float64)
 
-        # Ask should always be higher than bid
-        assert (
-            ask_price >= bid_price
-        ), f"Ask price should be >= bid price at index {i}: ask={ask_price}, bid={bid_price}"
+    # Ask should always be higher than bid
+    ordered = ask_price >= bid_price
+    i = np.argmin(ordered)
+    assert (
+        ordered.all()
+    ), f"Ask price should be >= bid price at index {i}: ask={ask_price[i]}, bid={bid_price[i]}"
 
-        # Spread should be reasonable (not zero, not excessive)
-        spread = ask_price - bid_price
-        spread_percentage = (spread / bid_price) * 100
+    # Spread should be reasonable (not zero, not excessive)
+    spread = ask_price - bid_price
+    spread_percentage = (spread / bid_price) * 100
 
-        assert spread >= 0, f"Spread should be positive at index {i}"
-        assert (
-            spread_percentage < 1.0
-        ), f"Spread seems excessive ({spread_percentage:.4f}%) at index {i}"
+    positive = spread >= 0
+    assert positive.all(), f"Spread should be positive at index {np.argmin(positive)}"
+
+    reasonable = spread_percentage < 1.0
+    i = np.argmin(reasonable)
+    assert (
+        reasonable.all()
+    ), f"Spread seems excessive ({spread_percentage[i]:.4f}%) at index {i}"
 
 
 def test_date_chronological_ordering(sample_market):
@@ -385,23 +377,20 @@ def test_date_chronological_ordering(sample_market):
     sample_market : Market
         Market fixture with loaded data
     """
-    # Test main dates vector
-    for i in range(1, len(sample_market.dates)):
-        assert (
-            sample_market.dates[i] > sample_market.dates[i - 1]
-        ), f"Dates not in chronological order at index {i}"
+    # Convert each date vector once so the checks run over whole arrays
+    dates = np.array(sample_market.dates, dtype="datetime64[us]")
+    ask_dates = np.array(sample_market.ask.dates, dtype="datetime64[us]")
+    bid_dates = np.array(sample_market.bid.dates, dtype="datetime64[us]")
 
-    # Test ask dates consistency
-    for i in range(len(sample_market.ask.dates)):
-        assert (
-            sample_market.ask.dates[i] == sample_market.dates[i]
-        ), f"Ask date mismatch at index {i}"
+    # Test main dates vector
+    increasing = np.diff(dates) > np.timedelta64(0, "us")
+    assert (
+        increasing.all()
+    ), f"Dates not in chronological order at index {np.argmin(increasing) + 1}"
 
-    # Test bid dates consistency
-    for i in range(len(sample_market.bid.dates)):
-        assert (
-            sample_market.bid.dates[i] == sample_market.dates[i]
-        ), f"Bid date mismatch at index {i}"
+    # Test ask and bid dates consistency
+    assert np.array_equal(ask_dates, dates), "Ask dates do not match market dates"
+    assert np.array_equal(bid_dates, dates), "Bid dates do not match market dates"
 
 
 def test_price_data_completeness(sample_market):
@@ -416,56 +405,21 @@ def test_price_data_completeness(sample_market):
     sample_market : Market
         Market fixture with loaded data
     """
-    # Check ask price completeness
-    assert len(sample_market.ask.open) == len(
-        sample_market.dates
-    ), "Ask open data incomplete"
-    assert len(sample_market.ask.high) == len(
-        sample_market.dates
-    ), "Ask high data incomplete"
-    assert len(sample_market.ask.low) == len(
-        sample_market.dates
-    ), "Ask low data incomplete"
-    assert len(sample_market.ask.close) == len(
-        sample_market.dates
-    ), "Ask close data incomplete"
+    n_dates = len(sample_market.dates)
 
-    # Check bid price completeness
-    assert len(sample_market.bid.open) == len(
-        sample_market.dates
-    ), "Bid open data incomplete"
-    assert len(sample_market.bid.high) == len(
-        sample_market.dates
-    ), "Bid high data incomplete"
-    assert len(sample_market.bid.low) == len(
-        sample_market.dates
-    ), "Bid low data incomplete"
-    assert len(sample_market.bid.close) == len(
-        sample_market.dates
-    ), "Bid close data incomplete"
-
-    # Check for NaN or invalid values
-    all_ask_prices = (
-        sample_market.ask.open
-        + sample_market.ask.high
-        + sample_market.ask.low
-        + sample_market.ask.close
-    )
-    all_bid_prices = (
-        sample_market.bid.open
-        + sample_market.bid.high
-        + sample_market.bid.low
-        + sample_market.bid.close
-    )
+    for side, prices in (("Ask", sample_market.ask), ("Bid", sample_market.bid)):
+        for column in ("open", "high", "low", "close"):
+            # Convert each column once and check it as a whole array
+            values = np.asarray(getattr(prices, column), dtype=np.float64)
 
-    assert all(
-        np.isfinite(price) for price in all_ask_prices
-    ), "Ask prices contain NaN or inf"
-    assert all(
-        np.isfinite(price) for price in all_bid_prices
-    ), "Bid prices contain NaN or inf"
-    assert all(price > 0 for price in all_ask_prices), "Ask prices should be positive"
-    assert all(price > 0 for price in all_bid_prices), "Bid prices should be positive"
+            # Check price completeness
+            assert len(values) == n_dates, f"{side} {column} data incomplete"
+
+            # Check for NaN or invalid values
+            assert np.isfinite(
+                values
+            ).all(), f"{side} {column} prices contain NaN or inf"
+            assert (values > 0).all(), f"{side} {column} prices should be positive"
 
 
 # ===============================
@@ -544,17 +498,22 @@ def test_loading_performance():
     Validates that database loading operations are performant
     and don't cause unacceptable delays in application startup.
     """
+    import statistics
     import time
 
-    market = Market()
+    def load_once():
+        market = Market()
+        start_time = time.perf_counter_ns()
+        market.load_from_database(
+            currency_0=Currency.EUR,
+            currency_1=Currency.USD,
+            time_span=1 * days,
+        )
+        return time.perf_counter_ns() - start_time
 
-    start_time = time.time()
-    market.load_from_database(
-        currency_0=Currency.EUR,
-        currency_1=Currency.USD,
-        time_span=1 * days,
-    )
-    loading_time = time.time() - start_time
+    # Warm up file caches so the first read does not dominate the measurement
+    load_once()
+    loading_time = statistics.median(load_once() for _ in range(3)) / 1e9
 
     # Should complete within reasonable time (adjust threshold as needed)
     max_time = 5.0  # 5 seconds for 1 day of data
@@ -774,6 +733,157 @@ def test_load_dataframe(currency_pair):
         pytest.skip(f"Currency pair {currency_pair} not available: {e}")
 
 
+def test_append_from_database_continues_loaded_range():
+    """
+    Appending after a load yields the same rows as a single longer load,
+    and appending past the end of the file is a no-op.
+    """
+    market = Market()
+    market.load_from_database(
+        currency_0=Currency.CAD, currency_1=Currency.USD, time_span=1 * days
+    )
+    n_loaded = len(market.dates)
+
+    n_appended = market.append_from_database(time_span=1 * days)
+    assert n_appended > 0
+    assert len(market.dates) == n_loaded + n_appended
+    assert market.end_date == market.dates[-1]
+
+    reference = Market()
+    reference.load_from_database(
+        currency_0=Currency.CAD, currency_1=Currency.USD, time_span=3 * days
+    )
+    n_total = len(market.dates)
+    assert market.dates == reference.dates[:n_total]
+    assert market.ask.close == reference.ask.close[:n_total]
+    assert market.bid.low == reference.bid.low[:n_total]
+
+    with pytest.raises(RuntimeError):
+        Market().append_from_database(time_span=1 * days)
+
+
+def test_add_market_arrays_matches_add_market_data():
+    """
+    Bulk column ingestion stores the same market as row-by-row insertion,
+    and rejects an invalid batch without modifying the market.
+    """
+    source = Market()
+    source.load_from_database(
+        currency_0=Currency.CAD, currency_1=Currency.USD, time_span=2 * hours
+    )
+
+    row_by_row = Market()
+    for idx, timestamp in enumerate(source.dates):
+        row_by_row.add_market_data(
+            timestamp,
+            source.ask.open[idx],
+            source.ask.high[idx],
+            source.ask.low[idx],
+            source.ask.close[idx],
+            source.bid.open[idx],
+            source.bid.high[idx],
+            source.bid.low[idx],
+            source.bid.close[idx],
+        )
+
+    bulk = Market()
+    bulk.add_market_arrays(
+        timestamps=source.dates,
+        ask_open=source.ask.open,
+        ask_low=source.ask.low,
+        ask_high=source.ask.high,
+        ask_close=source.ask.close,
+        bid_open=source.bid.open,
+        bid_low=source.bid.low,
+        bid_high=source.bid.high,
+        bid_close=source.bid.close,
+    )
+
+    assert bulk.dates == row_by_row.dates
+    assert bulk.start_date == row_by_row.start_date
+    assert bulk.end_date == row_by_row.end_date
+    for side in ("ask", "bid"):
+        for column in ("open", "high", "low", "close"):
+            assert getattr(getattr(bulk, side), column) == getattr(getattr(row_by_row, side), column)
+
+    # Bid above ask on the last row: the whole batch is rejected
+    ask = np.array(source.ask.close[:3])
+    bid = ask - 1e-4
+    bid[-1] = ask[-1] + 1e-4
+    with pytest.raises(ValueError):
+        bulk.add_market_arrays(
+            source.dates[-1:] * 3, ask, ask, ask, ask, bid, bid, bid, bid
+        )
+
+    assert len(bulk.dates) == len(source.dates)
+
+
+def test_add_ticks_matches_add_tick():
+    """
+    Bulk tick ingestion stores the same market as tick-by-tick insertion,
+    and rejects an invalid batch without modifying the market.
+    """
+    source = Market()
+    source.load_from_database(
+        currency_0=Currency.CAD, currency_1=Currency.USD, time_span=2 * hours
+    )
+    ask = np.asarray(source.ask.close)
+    bid = np.asarray(source.bid.close)
+
+    tick_by_tick = Market()
+    for timestamp, ask_price, bid_price in zip(source.dates, ask, bid):
+        tick_by_tick.add_tick(timestamp, ask_price, bid_price)
+
+    bulk = Market()
+    bulk.add_ticks(timestamps=source.dates, ask_prices=ask, bid_prices=bid)
+
+    assert bulk.dates == tick_by_tick.dates
+    assert bulk.end_date == tick_by_tick.end_date
+    for side in ("ask", "bid"):
+        for column in ("open", "high", "low", "close"):
+            assert getattr(getattr(bulk, side), column) == getattr(getattr(tick_by_tick, side), column)
+
+    with pytest.raises(ValueError):
+        bulk.add_ticks(source.dates[-1:] * 3, ask[:3], ask[:3] + 1e-4)
+
+    with pytest.raises(ValueError):
+        bulk.add_ticks(source.dates[-1:] * 3, ask[:2], bid[:2])
+
+    assert len(bulk.dates) == len(source.dates)
+
+
+def test_bulk_ingestion_accepts_datetime64_timestamps():
+    """
+    A NumPy datetime64 array of timestamps stores the same dates as the
+    equivalent list of datetime objects, down to the microsecond.
+    """
+    timestamps = [
+        datetime(2024, 1, 1, 9, 0),
+        datetime(2024, 1, 1, 9, 0, 30, 250),
+        datetime(2024, 1, 1, 10, 59, 59, 999999),
+        datetime(2024, 1, 2, 0, 0),
+    ]
+    ask = np.full(len(timestamps), 1.1055)
+    bid = ask - 1e-4
+
+    from_datetimes = Market()
+    from_datetimes.add_ticks(timestamps, ask, bid)
+
+    from_datetime64 = Market()
+    from_datetime64.add_ticks(np.array(timestamps, dtype="datetime64[us]"), ask, bid)
+
+    assert from_datetime64.dates == from_datetimes.dates
+    assert from_datetime64.end_date == from_datetimes.end_date
+
+    from_datetime64.add_market_arrays(
+        np.array(["2024-01-02T00:01"], dtype="datetime64[m]"), *[ask[:1]] * 4, *[bid[:1]] * 4
+    )
+    assert from_datetime64.dates[-1] == datetime(2024, 1, 2, 0, 1)
+
+    with pytest.raises(ValueError):
+        Market().add_ticks(np.array(["NaT"], dtype="datetime64[s]"), ask[:1], bid[:1])
+
+
 # ===============================
 # Test Execution
 # ===============================
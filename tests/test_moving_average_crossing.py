@@ -1,19 +1,16 @@
 import gc
+import tracemalloc
 import time
 import pytest
 import numpy as np
 from datetime import datetime, timedelta
-from unittest.mock import patch
 import matplotlib.pyplot as plt
 
 from TradeTide.indicators.moving_average_crossings import MovingAverageCrossing
 from TradeTide.market import Market
 from TradeTide.times import minutes, hours, days
 from TradeTide.currencies import Currency
-import TradeTide
 
-# Enable debug mode for detailed logging during test execution
-TradeTide.debug_mode = True
 
 # ===============================
 # Test Configuration and Constants
@@ -41,7 +38,7 @@ def indicator():
     return MovingAverageCrossing(short_window=SHORT_WINDOW, long_window=LONG_WINDOW)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_prices():
     """Generate sample price data for testing various market scenarios.
 
@@ -81,7 +78,7 @@ def sample_prices():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def trending_up_prices():
     """Generate consistently upward trending price data for bullish market testing.
 
@@ -90,10 +87,10 @@ def trending_up_prices():
     numpy.ndarray
         Array of steadily increasing prices that simulate a strong bullish market trend for testing positive crossing scenarios and trend detection accuracy.
     """
-    return np.array([100.0 + i * 0.5 for i in range(30)])
+    return 100.0 + 0.5 * np.arange(30, dtype=np.float64)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def trending_down_prices():
     """Generate consistently downward trending price data for bearish market testing.
 
@@ -102,10 +99,10 @@ def trending_down_prices():
     numpy.ndarray
         Array of steadily decreasing prices that simulate a strong bearish market trend for testing negative crossing scenarios and trend reversal detection.
     """
-    return np.array([130.0 - i * 0.5 for i in range(30)])
+    return 130.0 - 0.5 * np.arange(30, dtype=np.float64)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def volatile_prices():
     """Generate highly volatile price data for stress testing indicator stability.
 
@@ -114,12 +111,13 @@ def volatile_prices():
     numpy.ndarray
         Array of highly volatile prices with significant fluctuations that test the indicator's ability to handle extreme market conditions and noise reduction capabilities.
     """
-    base_prices = np.array([100.0 + i * 0.1 for i in range(50)])
-    noise = np.random.normal(0, 2.0, 50)
+    rng = np.random.default_rng(0)
+    base_prices = 100.0 + 0.1 * np.arange(50, dtype=np.float64)
+    noise = rng.normal(0, 2.0, 50)
     return base_prices + noise
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_market():
     """Create a sample Market object with realistic price data for integration testing.
 
@@ -129,23 +127,23 @@ def sample_market():
         A Market instance populated with sample date/price data that provides a realistic testing environment for indicator integration and end-to-end functionality validation.
     """
     dates = [DEFAULT_START_DATE + i * minutes for i in range(100)]
-    prices = [100.0 + np.sin(i * 0.1) * 10 + np.random.normal(0, 1) for i in range(100)]
+    noise = np.random.default_rng(0).normal(0, 1, 100)
+    prices = 100.0 + np.sin(np.arange(100) * 0.1) * 10 + noise
+    ask_price = np.abs(prices) * 1.001
+    bid_price = np.abs(prices) * 0.999
+
     market = Market()
-    for date, price in zip(dates, prices):
-        ask_price = price * 1.001
-        bid_price = price * 0.999
-
-        market.add_market_data(
-            timestamp=date,
-            ask_open=ask_price,
-            ask_high=ask_price,
-            ask_low=ask_price,
-            ask_close=ask_price,
-            bid_open=bid_price,
-            bid_high=bid_price,
-            bid_low=bid_price,
-            bid_close=bid_price,
-        )
+    market.add_market_arrays(
+        timestamps=dates,
+        ask_open=ask_price,
+        ask_high=ask_price,
+        ask_low=ask_price,
+        ask_close=ask_price,
+        bid_open=bid_price,
+        bid_high=bid_price,
+        bid_low=bid_price,
+        bid_close=bid_price,
+    )
     return market
 
 
@@ -245,7 +243,7 @@ def test_moving_average_array_lengths(sample_market):
 def test_moving_average_computation_accuracy():
     """Test accuracy of moving average computations by comparing calculated values with manually computed expected results for known input sequences ensuring mathematical correctness and numerical precision within acceptable tolerance levels."""
     # Create simple increasing sequence for predictable calculations
-    simple_prices = [float(i + 1) for i in range(10)]  # [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    simple_prices = np.arange(1.0, 11.0)  # [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 
     indicator = MovingAverageCrossing(short_window=3 * minutes, long_window=5 * minutes)
     indicator._cpp_run_with_vector(simple_prices)
@@ -268,78 +266,53 @@ def test_moving_average_computation_accuracy():
     ), f"Expected long MA[4] = 3.0, got {long_ma[4]}"
 
 
-def test_golden_cross_signal_detection():
-    """Test detection of golden cross signals when short moving average crosses above long moving average ensuring proper signal generation with correct timing and magnitude for bullish crossover patterns in various market conditions."""
-    # Create falling then rising price pattern to generate golden cross
-    prices = [
-        10.0,
-        9.0,
-        8.0,
-        7.0,
-        6.0,
-        5.0,
-        6.0,
-        7.0,
-        8.0,
-        9.0,
-        10.0,
-        11.0,
-        12.0,
-        13.0,
-        14.0,
-        15.0,
-        16.0,
-        17.0,
-        18.0,
-        19.0,
-    ]
+@pytest.fixture(scope="module")
+def crossing_indicator():
+    """Short 3-minute / long 5-minute crossing indicator shared by the crossover cases.
 
-    indicator = MovingAverageCrossing(short_window=3 * minutes, long_window=5 * minutes)
-    indicator._cpp_run_with_vector(prices)
+    Returns
+    -------
+    MovingAverageCrossing
+        Indicator reused across runs; each run overwrites its buffers in place.
+    """
+    return MovingAverageCrossing(short_window=3 * minutes, long_window=5 * minutes)
+
+
+CROSSOVER_CASES = [
+    # Falling then rising prices: golden cross (short MA crosses above long MA)
+    pytest.param(
+        np.concatenate([np.arange(10.0, 4.0, -1.0), np.arange(6.0, 20.0)]),
+        1,
+        id="golden_cross",
+    ),
+    # Rising then falling prices: death cross (short MA crosses below long MA)
+    pytest.param(
+        np.concatenate([np.arange(5.0, 11.0), np.arange(9.0, 0.0, -1.0), np.arange(2.0, 7.0)]),
+        -1,
+        id="death_cross",
+    ),
+]
 
-    regions = np.asarray(indicator._cpp_regions)
-    # Look for positive signals (golden cross)
-    positive_signals = np.where(regions > 0)[0]
-    assert (
-        len(positive_signals) > 0
-    ), "Should detect at least one golden cross signal in rising price pattern"
-
-
-def test_death_cross_signal_detection():
-    """Test detection of death cross signals when short moving average crosses below long moving average ensuring proper signal generation with correct timing and magnitude for bearish crossover patterns in declining market conditions."""
-    # Create rising then falling price pattern to generate death cross
-    prices = [
-        5.0,
-        6.0,
-        7.0,
-        8.0,
-        9.0,
-        10.0,
-        9.0,
-        8.0,
-        7.0,
-        6.0,
-        5.0,
-        4.0,
-        3.0,
-        2.0,
-        1.0,
-        2.0,
-        3.0,
-        4.0,
-        5.0,
-        6.0,
-    ]
 
-    indicator = MovingAverageCrossing(short_window=3 * minutes, long_window=5 * minutes)
-    indicator._cpp_run_with_vector(prices)
+@pytest.mark.parametrize("prices, expected_sign", CROSSOVER_CASES)
+def test_crossover_signal_detection(crossing_indicator, prices, expected_sign):
+    """Test detection of golden and death cross signals on price patterns that reverse direction ensuring at least one region of the expected sign is generated.
 
-    regions = np.asarray(indicator._cpp_regions)
-    # Look for negative signals (death cross)
-    negative_signals = np.where(regions < 0)[0]
+    Parameters
+    ----------
+    crossing_indicator : MovingAverageCrossing
+        Shared indicator fixture, re-run on each price pattern.
+    prices : numpy.ndarray
+        Price pattern producing the crossover.
+    expected_sign : int
+        Sign of the expected region: 1 for a golden cross, -1 for a death cross.
+    """
+    crossing_indicator._cpp_run_with_vector(prices)
+
+    regions = np.asarray(crossing_indicator._cpp_regions)
     assert (
-        len(negative_signals) > 0
-    ), "Should detect at least one death cross signal in falling price pattern"
+        np.count_nonzero(np.sign(regions) == expected_sign) > 0
+    ), f"Should detect at least one region of sign {expected_sign}"
 
 
 def test_no_signals_in_sideways_market():
@@ -408,7 +381,7 @@ def test_moving_averages_smooth_price_data(volatile_prices):
     indicator = MovingAverageCrossing(
         short_window=5 * minutes, long_window=10 * minutes
     )
-    indicator._cpp_run_with_vector(volatile_prices.tolist())
+    indicator._cpp_run_with_vector(volatile_prices)
 
     short_ma = np.asarray(indicator._cpp_short_moving_average)
     long_ma = np.asarray(indicator._cpp_long_moving_average)
@@ -441,9 +414,8 @@ def test_plot_method_execution(sample_market):
 
     # Test plot method execution (requires matplotlib)
     try:
-        with patch("matplotlib.pyplot.show"):  # Mock plt.show to prevent display
-            figure = indicator.plot(show=False)
-            assert isinstance(figure, plt.Figure), "Plot should return a figure object"
+        figure = indicator.plot(show=False)
+        assert isinstance(figure, plt.Figure), "Plot should return a figure object"
     except ImportError:
         pytest.skip("Matplotlib not available for plotting tests")
     except Exception as e:
@@ -453,9 +425,8 @@ def test_plot_method_execution(sample_market):
 def test_performance_with_large_dataset():
     """Test performance characteristics with large datasets ensuring acceptable computation times for enterprise-scale market data processing and memory usage optimization validation under high-volume scenarios."""
     # Create large dataset for performance testing
-    large_prices = [
-        100.0 + np.sin(i * 0.001) * 10 + np.random.normal(0, 0.5) for i in range(10000)
-    ]
+    rng = np.random.default_rng(0)
+    large_prices = 100.0 + np.sin(np.arange(10000) * 0.001) * 10 + rng.normal(0, 0.5, 10000)
 
     indicator = MovingAverageCrossing(
         short_window=SHORT_WINDOW, long_window=LONG_WINDOW
@@ -476,11 +447,15 @@ def test_performance_with_large_dataset():
 
 def test_memory_usage_and_cleanup():
     """Test memory usage patterns and garbage collection effectiveness ensuring proper cleanup of resources after indicator computation and verification of memory leak prevention in repeated execution scenarios."""
-    initial_objects = len(gc.get_objects())
+    rng = np.random.default_rng(0)
+    n_iterations = 100
+
+    tracemalloc.start()
+    initial_memory, _ = tracemalloc.get_traced_memory()
 
     # Create and run multiple indicators to test memory management
-    for i in range(100):
-        prices = [100.0 + np.random.normal(0, 1) for _ in range(100)]
+    for i in range(n_iterations):
+        prices = 100.0 + rng.normal(0, 1, 100)
 
         indicator = MovingAverageCrossing(
             short_window=SHORT_WINDOW, long_window=LONG_WINDOW
@@ -490,13 +465,14 @@ def test_memory_usage_and_cleanup():
 
     # Force garbage collection
     gc.collect()
-    final_objects = len(gc.get_objects())
+    final_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
 
-    # Memory usage should not grow excessively
-    object_growth = final_objects - initial_objects
+    # A leaked indicator keeps a few hundred bytes of Python objects alive per iteration
+    memory_growth = final_memory - initial_memory
     assert (
-        object_growth < 1000
-    ), f"Excessive object growth: {object_growth} new objects remain"
+        memory_growth < 100 * n_iterations
+    ), f"Excessive memory growth: {memory_growth} bytes remain after {n_iterations} iterations"
 
 
 @pytest.mark.parametrize("frequency", [1, 5, 15, 60])
@@ -511,10 +487,9 @@ def test_different_market_data_frequencies(frequency):
     # Create market data with specified frequency
     time_delta = timedelta(minutes=frequency)
     dates = [DEFAULT_START_DATE + i * time_delta for i in range(50)]
-    prices = [100.0 + np.sin(i * 0.1) * 5 for i in range(50)]
+    prices = 100.0 + np.sin(np.arange(50) * 0.1) * 5
     market = Market()
-    for date, price in zip(dates, prices):
-        market.add_tick(timestamp=date, bid_price=price - 0.01, ask_price=price + 0.01)
+    market.add_ticks(timestamps=dates, ask_prices=prices + 0.01, bid_prices=prices - 0.01)
 
     # Adjust window sizes based on frequency
     short_win = max(5 * time_delta, 5 * minutes)
@@ -549,12 +524,9 @@ def test_extreme_value_handling(price_range):
     """
     min_price, max_price = price_range
     dates = [DEFAULT_START_DATE + i * minutes for i in range(30)]
-    prices = [
-        min_price + (max_price - min_price) * np.random.random() for _ in range(30)
-    ]
+    prices = np.random.default_rng(0).uniform(min_price, max_price, 30)
     market = Market()
-    for date, price in zip(dates, prices):
-        market.add_tick(timestamp=date, bid_price=price - 0.01, ask_price=price + 0.01)
+    market.add_ticks(timestamps=dates, ask_prices=prices + 0.01, bid_prices=prices - 0.01)
 
     indicator = MovingAverageCrossing(
         short_window=5 * minutes, long_window=10 * minutes
@@ -606,10 +578,9 @@ def test_signal_region_values(sample_market):
 def test_multiple_indicator_instances():
     """Test creation and execution of multiple indicator instances with different parameters ensuring proper isolation between instances and correct independent operation without cross-contamination of results."""
     dates = [DEFAULT_START_DATE + i * minutes for i in range(50)]
-    prices = [100.0 + np.sin(i * 0.1) * 5 for i in range(50)]
+    prices = 100.0 + np.sin(np.arange(50) * 0.1) * 5
     market = Market()
-    for date, price in zip(dates, prices):
-        market.add_tick(timestamp=date, bid_price=price - 0.01, ask_price=price + 0.01)
+    market.add_ticks(timestamps=dates, ask_prices=prices + 0.01, bid_prices=prices - 0.01)
 
     # Create multiple indicators with different parameters
     indicator1 = MovingAverageCrossing(
@@ -7,13 +7,45 @@ from TradeTide.position_collection import PositionCollection
 from TradeTide.currencies import Currency
 from TradeTide.signal import Signal
 from TradeTide import capital_management, exit_strategy
-import TradeTide
 
-TradeTide.debug_mode = True  # Enable debug mode for development purpose
 
+@pytest.fixture(scope="module")
+def sample_market():
+    """
+    Create a CAD/USD market shared by the position and portfolio tests.
 
+    Returns
+    -------
+    Market
+        Market instance with CAD/USD data for 3 hours
+    """
+    market = Market()
+    market.load_from_database(
+        currency_0=Currency.CAD,
+        currency_1=Currency.USD,
+        time_span=timedelta(hours=3),
+    )
+    return market
+
+
+@pytest.fixture(scope="module")
+def sample_signal(sample_market):
+    """
+    Create a random trade signal aligned with the sample market.
+
+    Returns
+    -------
+    Signal
+        Signal with a 12% chance of a trade at each tick
+    """
+    signal = Signal(market=sample_market)
+    signal.generate_random(probability=0.12)
+    return signal
+
+
+@pytest.mark.usefixtures("debug_mode")
 def test_portfolio_simulation_workflow():
-    """Full end-to-end test of portfolio simulation with random signal."""
+    """Full end-to-end test of portfolio simulation with random signal, with debug logging enabled."""
 
     # Setup market
     market = Market()
@@ -70,5 +102,107 @@ def test_portfolio_simulation_workflow():
     portfolio.plot_positions(max_positions=100, show=False)
 
 
+def test_portfolio_without_history(sample_market, sample_signal):
+    """Disabling history keeps the simulation result but records nothing."""
+    position_collection = PositionCollection(market=sample_market, trade_signal=sample_signal.trade_signal)
+    position_collection.open_and_propagate_positions(
+        exit_strategy=exit_strategy.Static(stop_loss=4, take_profit=4)
+    )
+
+    capital_manager = capital_management.FixedLot(
+        capital=100_000,
+        fixed_lot_size=100,
+        max_capital_at_risk=10_000,
+        max_concurrent_positions=5,
+    )
+
+    recorded = Portfolio(position_collection=position_collection)
+    recorded.simulate(capital_management=capital_manager)
+
+    headless = Portfolio(position_collection=position_collection, save_history=False)
+    headless.simulate(capital_management=capital_manager)
+
+    assert len(headless.record.equity) == 0, "History recorded despite save_history=False"
+    assert headless.state.equity == recorded.state.equity
+    assert headless.state.capital == recorded.state.capital
+    assert len(headless.get_positions()) == len(recorded.get_positions())
+
+    with pytest.raises(RuntimeError, match="Metrics require the portfolio history"):
+        headless.get_metrics()
+
+
+def test_record_history_survives_resimulation(sample_market, sample_signal):
+    """History arrays taken from the record keep their values when the portfolio is simulated again."""
+    position_collection = PositionCollection(market=sample_market, trade_signal=sample_signal.trade_signal)
+    position_collection.open_and_propagate_positions(
+        exit_strategy=exit_strategy.Static(stop_loss=4, take_profit=4)
+    )
+
+    portfolio = Portfolio(position_collection=position_collection)
+    portfolio.simulate(
+        capital_management=capital_management.FixedLot(
+            capital=100_000, fixed_lot_size=100, max_capital_at_risk=10_000, max_concurrent_positions=5
+        )
+    )
+    equity = portfolio.record.equity
+    expected = equity.copy()
+
+    portfolio.simulate(
+        capital_management=capital_management.FixedLot(
+            capital=50_000, fixed_lot_size=10, max_capital_at_risk=10_000, max_concurrent_positions=5
+        )
+    )
+
+    numpy.testing.assert_array_equal(equity, expected)
+    assert portfolio.record.equity[0] == 50_000
+
+
+def test_open_and_propagate_matches_two_pass(sample_market, sample_signal):
+    """Fused open/propagate yields the same positions as the two separate passes."""
+    strategy = exit_strategy.Static(stop_loss=4, take_profit=4)
+
+    two_pass = PositionCollection(market=sample_market, trade_signal=sample_signal.trade_signal)
+    two_pass.open_positions(exit_strategy=strategy)
+    two_pass.propagate_positions()
+
+    fused = PositionCollection(market=sample_market, trade_signal=sample_signal.trade_signal)
+    fused.open_and_propagate_positions(exit_strategy=strategy)
+
+    assert len(fused) == len(two_pass) > 0, "Fused pass opened a different number of positions"
+    assert fused.get_start_dates() == two_pass.get_start_dates()
+    assert fused.get_close_dates() == two_pass.get_close_dates()
+    numpy.testing.assert_array_equal(fused.get_exit_prices(), two_pass.get_exit_prices())
+
+
+def test_position_columns_match_positions(sample_market, sample_signal):
+    """The position columns expose the same values as the per-position accessors."""
+    position_collection = PositionCollection(market=sample_market, trade_signal=sample_signal.trade_signal)
+    position_collection.open_and_propagate_positions(exit_strategy=exit_strategy.Static(stop_loss=4, take_profit=4))
+
+    n_positions = len(position_collection)
+    assert n_positions > 0
+
+    numpy.testing.assert_array_equal(position_collection.entry_prices, position_collection.get_entry_prices())
+    numpy.testing.assert_array_equal(position_collection.exit_prices, position_collection.get_exit_prices())
+    assert len(position_collection.stop_loss_prices) == n_positions
+
+    dates = numpy.asarray(sample_market.dates)
+    assert list(dates[position_collection.start_indices]) == position_collection.get_start_dates()
+    assert list(dates[position_collection.close_indices]) == position_collection.get_close_dates()
+
+
+def test_position_columns_survive_repropagation(sample_market, sample_signal):
+    """Columns read before a second open/propagate pass keep their values."""
+    position_collection = PositionCollection(market=sample_market, trade_signal=sample_signal.trade_signal)
+    position_collection.open_and_propagate_positions(exit_strategy=exit_strategy.Static(stop_loss=4, take_profit=4))
+
+    exit_prices = position_collection.exit_prices
+    expected = exit_prices.copy()
+
+    position_collection.open_and_propagate_positions(exit_strategy=exit_strategy.Static(stop_loss=16, take_profit=16))
+
+    numpy.testing.assert_array_equal(exit_prices, expected)
+
+
 if __name__ == "__main__":
     pytest.main(["-W error", __file__])
@@ -31,17 +31,14 @@ from TradeTide.market import Market
 from TradeTide.signal import Signal
 from TradeTide.currencies import Currency
 from TradeTide.times import days, hours
-import TradeTide
 
-# Enable debug mode for detailed logging during test execution
-TradeTide.debug_mode = True
 
 # ===============================
 # Test Fixtures and Setup
 # ===============================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def market():
     """
     Create a standard market fixture for testing signal functionality.
@@ -67,7 +64,7 @@ def market():
     return market
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def large_market():
     """
     Create a larger market dataset for performance and statistical testing.
@@ -93,7 +90,7 @@ def large_market():
     return market
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def small_market():
     """
     Create a minimal market dataset for edge case testing.
@@ -421,6 +418,33 @@ def test_signal_validation_after_random_generation(market):
     ), "Signal failed validation after random generation"
 
 
+def test_trade_signal_assignment(market):
+    """
+    Test assigning a trade signal from Python.
+
+    Validates that a signal of the market's length replaces the stored one,
+    that arrays read earlier keep their values, and that a signal of any
+    other length is rejected.
+
+    Parameters
+    ----------
+    market : Market
+        Market fixture for testing
+    """
+    signal = Signal(market)
+    signal.generate_random(probability=0.3)
+    previous = signal.trade_signal
+    expected = previous.copy()
+
+    signal.trade_signal = np.ones(len(market.dates), dtype=int)
+
+    assert (signal.trade_signal == 1).all(), "Assigned signal was not stored"
+    np.testing.assert_array_equal(previous, expected)
+
+    with pytest.raises(ValueError, match="match the market length"):
+        signal.trade_signal = [1, 0, -1]
+
+
 def test_signal_validation_comprehensive(large_market):
     """
     Test comprehensive signal validation with larger dataset.
@@ -0,0 +1,63 @@
+import pytest
+import numpy as np
+from datetime import timedelta
+
+from TradeTide import Strategy
+from TradeTide.market import Market
+from TradeTide.currencies import Currency
+from TradeTide.indicators import BollingerBands, RelativeMomentumIndex
+from TradeTide.times import minutes
+
+
+@pytest.fixture
+def market():
+    market = Market()
+    market.load_from_database(
+        currency_0=Currency.CAD,
+        currency_1=Currency.USD,
+        time_span=timedelta(hours=12),
+    )
+    return market
+
+
+def single_indicator_signal(indicator, market) -> np.ndarray:
+    strategy = Strategy()
+    strategy.add_indicator(indicator)
+    return strategy.get_trade_signal(market)
+
+
+def test_combined_signal_matches_individual_indicators(market):
+    """Running indicators together gives the consensus of their stand-alone signals."""
+    bollinger = BollingerBands(window=3 * minutes, multiplier=1.0)
+    momentum = RelativeMomentumIndex(momentum_period=2 * minutes, smooth_window=4 * minutes)
+
+    strategy = Strategy()
+    strategy.add_indicator(bollinger)
+    strategy.add_indicator(momentum)
+    combined = strategy.get_trade_signal(market)
+
+    expected = np.sign(
+        single_indicator_signal(BollingerBands(window=3 * minutes, multiplier=1.0), market)
+        + single_indicator_signal(RelativeMomentumIndex(momentum_period=2 * minutes, smooth_window=4 * minutes), market)
+    )
+
+    assert len(combined) == len(market.dates)
+    np.testing.assert_array_equal(combined, expected)
+
+
+def test_same_indicator_added_twice(market):
+    """An indicator instance added twice counts twice without its buffers being clobbered."""
+    bollinger = BollingerBands(window=3 * minutes, multiplier=1.0)
+
+    strategy = Strategy()
+    strategy.add_indicator(bollinger)
+    strategy.add_indicator(bollinger)
+
+    np.testing.assert_array_equal(
+        strategy.get_trade_signal(market),
+        single_indicator_signal(BollingerBands(window=3 * minutes, multiplier=1.0), market),
+    )
+
+
+if __name__ == "__main__":
+    pytest.main(["-W error", __file__])